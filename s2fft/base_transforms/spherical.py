@@ -2,6 +2,7 @@ from functools import partial
 from warnings import warn
 
 import numpy as np
+import scipy.fft as sfft
 
 from s2fft import recursions
 from s2fft.sampling import s2_samples as samples
@@ -17,11 +18,14 @@ def inverse(
     nside: int = None,
     reality: bool = False,
     L_lower: int = 0,
+    dtype: np.dtype = np.complex128,
 ) -> np.ndarray:
     r"""
     Compute inverse spherical harmonic transform.
 
-    Uses a vectorised separation of variables method with np.fft.
+    Uses a vectorised separation of variables method with scipy.fft.  The FFTs run
+    with scipy's default number of workers, which can be raised by calling the
+    transform inside a :func:`scipy.fft.set_workers` context.
 
     Args:
         flm (np.ndarray): Spherical harmonic coefficients.
@@ -43,6 +47,11 @@ def inverse(
         L_lower (int, optional): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`. Defaults to 0.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Single precision (np.complex64) halves memory traffic and speeds
+            up the FFTs, at the cost of accuracy (roughly 7 significant digits rather
+            than 15).  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Signal on the sphere.
 
@@ -56,6 +65,7 @@ def inverse(
         method="sov_fft_vectorized",
         reality=reality,
         L_lower=L_lower,
+        dtype=dtype,
     )
 
 
@@ -68,6 +78,7 @@ def _inverse(
     nside: int = None,
     reality: bool = False,
     L_lower: int = 0,
+    dtype: np.dtype = np.complex128,
 ) -> np.ndarray:
     r"""
     Compute inverse spherical harmonic transform using a specified method.
@@ -96,6 +107,9 @@ def _inverse(
         L_lower (int, optional): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`. Defaults to 0.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Signal on the sphere.
 
@@ -128,6 +142,7 @@ def _inverse(
         nside=nside,
         reality=reality,
         L_lower=L_lower,
+        dtype=dtype,
     )
 
 
@@ -140,11 +155,14 @@ def forward(
     reality: bool = False,
     L_lower: int = 0,
     iter: int = 0,
+    dtype: np.dtype = np.complex128,
 ) -> np.ndarray:
     r"""
     Compute forward spherical harmonic transform.
 
-    Uses a vectorised separation of variables method with np.fft.
+    Uses a vectorised separation of variables method with scipy.fft.  The FFTs run
+    with scipy's default number of workers, which can be raised by calling the
+    transform inside a :func:`scipy.fft.set_workers` context.
 
     Args:
         f (np.ndarray): Signal on the sphere.
@@ -172,6 +190,11 @@ def forward(
             theorem, and round-tripping through the forward and inverse transforms will
             introduce an error.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Single precision (np.complex64) halves memory traffic and speeds
+            up the FFTs, at the cost of accuracy (roughly 7 significant digits rather
+            than 15).  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Spherical harmonic coefficients.
 
@@ -184,6 +207,7 @@ def forward(
         "method": "sov_fft_vectorized",
         "reality": reality,
         "L_lower": L_lower,
+        "dtype": dtype,
     }
     if iter == 0:
         return _forward(f, **common_kwargs)
@@ -205,6 +229,7 @@ def _forward(
     nside: int = None,
     reality: bool = False,
     L_lower: int = 0,
+    dtype: np.dtype = np.complex128,
 ):
     r"""
     Compute forward spherical harmonic transform using a specified method.
@@ -233,6 +258,9 @@ def _forward(
         L_lower (int, optional): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`. Defaults to 0.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Spherical harmonic coefficients.
 
@@ -260,6 +288,9 @@ def _forward(
     else:
         thetas = samples.thetas(L, sampling, nside)
 
+    # Evaluate the Fourier transforms at the precision of the requested dtype.
+    f = f.astype(dtype if np.iscomplexobj(f) else np.finfo(dtype).dtype, copy=False)
+
     # Don't need to include spin in weights (even for spin signals)
     # since accounted for already in periodic extension and upsampling.
     weights = quadrature.quad_weights_transform(L, sampling, 0, nside)
@@ -280,6 +311,7 @@ def _forward(
         nside=nside,
         reality=reality,
         L_lower=L_lower,
+        dtype=dtype,
     )
 
 
@@ -292,6 +324,7 @@ def _compute_inverse_direct(
     nside: int,
     reality: bool,
     L_lower: int,
+    dtype: np.dtype = np.complex128,
 ):
     r"""
     Compute inverse spherical harmonic transform directly.
@@ -317,6 +350,9 @@ def _compute_inverse_direct(
         L_lower (int): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`.  Defaults to 0.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Signal on the sphere.
 
@@ -324,47 +360,36 @@ def _compute_inverse_direct(
     if sampling.lower() != "healpix":
         phis_ring = samples.phis_equiang(L, sampling)
 
-    f = np.zeros(samples.f_shape(L, sampling, nside), dtype=np.complex128)
+    f = np.zeros(samples.f_shape(L, sampling, nside), dtype=dtype)
+
+    elfactors = np.sqrt((2 * np.arange(L) + 1) / (4 * np.pi))
+    spin_sign = (-1) ** spin
+
+    ms = np.arange(-L + 1, L)
 
     for t, theta in enumerate(thetas):
         if sampling.lower() == "healpix":
             phis_ring = samples.phis_ring(t, nside)
+            entry = [samples.hp_ang2pix(nside, theta, phi) for phi in phis_ring]
+        else:
+            entry = t
+
+        # Harmonics exp(i m phi) evaluated at every sample of the ring.
+        exps = np.exp(1j * np.outer(ms, phis_ring))
 
         for el in range(max(L_lower, abs(spin)), L):
             dl = recursions.turok.compute_slice(theta, el, L, -spin, reality)
 
-            elfactor = np.sqrt((2 * el + 1) / (4 * np.pi))
-
-            for p, phi in enumerate(phis_ring):
-                if sampling.lower() != "healpix":
-                    entry = (t, p)
-
-                else:
-                    entry = samples.hp_ang2pix(nside, theta, phi)
-
-                if reality:
-                    f[entry] += (
-                        (-1) ** spin * elfactor * dl[L - 1] * flm[el, L - 1]
-                    )  # m = 0
-                    for m in range(1, el + 1):
-                        val = (
-                            (-1) ** spin
-                            * elfactor
-                            * np.exp(1j * m * phi)
-                            * dl[m + L - 1]
-                            * flm[el, m + L - 1]
-                        )
-                        f[entry] += val + np.conj(val)
-
-                else:
-                    for m in range(-el, el + 1):
-                        f[entry] += (
-                            (-1) ** spin
-                            * elfactor
-                            * np.exp(1j * m * phi)
-                            * dl[m + L - 1]
-                            * flm[el, m + L - 1]
-                        )
+            elfactor = spin_sign * elfactors[el]
+
+            if reality:
+                vals = elfactor * dl[L - 1 : L + el] * flm[el, L - 1 : L + el]
+                f[entry] += vals[0] + 2 * np.real(vals[1:] @ exps[L : L + el])
+
+            else:
+                f[entry] += (
+                    elfactor * dl[L - 1 - el : L + el] * flm[el, L - 1 - el : L + el]
+                ) @ exps[L - 1 - el : L + el]
 
     return f
 
@@ -378,6 +403,7 @@ def _compute_inverse_sov(
     nside: int,
     reality: bool,
     L_lower: int,
+    dtype: np.dtype = np.complex128,
 ):
     r"""
     Compute inverse spherical harmonic transform by separation of variables with a
@@ -404,41 +430,44 @@ def _compute_inverse_sov(
         L_lower (int): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`.  Defaults to 0.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Signal on the sphere.
 
     """
-    ftm = np.zeros((len(thetas), 2 * L - 1), dtype=np.complex128)
+    ftm = np.zeros((len(thetas), 2 * L - 1), dtype=dtype)
+    elfactors = np.sqrt((2 * np.arange(L) + 1) / (4 * np.pi))
+    spin_sign = (-1) ** spin
+
     for t, theta in enumerate(thetas):
         for el in range(max(L_lower, abs(spin)), L):
             dl = recursions.turok.compute_slice(theta, el, L, -spin, reality)
-            elfactor = np.sqrt((2 * el + 1) / (4 * np.pi))
+            elfactor = spin_sign * elfactors[el]
 
             m_start_ind = 0 if reality else -el
             for m in range(m_start_ind, el + 1):
-                ftm[t, m + L - 1] += (
-                    (-1) ** spin * elfactor * dl[m + L - 1] * flm[el, m + L - 1]
-                )
+                ftm[t, m + L - 1] += elfactor * dl[m + L - 1] * flm[el, m + L - 1]
 
-    f = np.zeros(samples.f_shape(L, sampling, nside), dtype=np.complex128)
+    def ftm_to_f(ftm_rows, exps):
+        if reality:
+            return ftm_rows[..., L - 1 : L] + 2 * np.real(ftm_rows[..., L:] @ exps[L:])
+        else:
+            return ftm_rows @ exps
+
+    f = np.zeros(samples.f_shape(L, sampling, nside), dtype=dtype)
+    ms = np.arange(-L + 1, L)
     if sampling.lower() != "healpix":
-        phis_ring = samples.phis_equiang(L, sampling)
-    for t, theta in enumerate(thetas):
-        if sampling.lower() == "healpix":
+        # All rings share the same phi samples, so the sum over m for every ring
+        # is a single product with the matrix of harmonics exp(i m phi).
+        exps = np.exp(1j * np.outer(ms, samples.phis_equiang(L, sampling)))
+        f[:] = ftm_to_f(ftm, exps)
+    else:
+        for t, theta in enumerate(thetas):
             phis_ring = samples.phis_ring(t, nside)
-        for p, phi in enumerate(phis_ring):
-            if sampling.lower() != "healpix":
-                entry = (t, p)
-            else:
-                entry = samples.hp_ang2pix(nside, theta, phi)
-            if reality:
-                f[entry] += ftm[t, L - 1]  # m = 0
-                for m in range(1, L):
-                    val = ftm[t, m + L - 1] * np.exp(1j * m * phi)
-                    f[entry] += val + np.conj(val)
-            else:
-                for m in range(-(L - 1), L):
-                    f[entry] += ftm[t, m + L - 1] * np.exp(1j * m * phi)
+            entry = [samples.hp_ang2pix(nside, theta, phi) for phi in phis_ring]
+            f[entry] = ftm_to_f(ftm[t], np.exp(1j * np.outer(ms, phis_ring)))
 
     return f
 
@@ -452,6 +481,7 @@ def _compute_inverse_sov_fft(
     nside: int,
     reality: bool,
     L_lower: int,
+    dtype: np.dtype = np.complex128,
 ):
     r"""
     Compute inverse spherical harmonic transform by separation of variables with a
@@ -478,6 +508,9 @@ def _compute_inverse_sov_fft(
         L_lower (int): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`.  Defaults to 0.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Signal on the sphere.
 
@@ -485,33 +518,31 @@ def _compute_inverse_sov_fft(
     if sampling.lower() == "healpix":
         assert L >= 2 * nside
 
-    ftm = np.zeros(samples.ftm_shape(L, sampling, nside), dtype=np.complex128)
+    ftm = np.zeros(samples.ftm_shape(L, sampling, nside), dtype=dtype)
     m_offset = 1 if sampling in ["mwss", "healpix"] else 0
 
+    elfactors = np.sqrt((2 * np.arange(L) + 1) / (4 * np.pi))
+    spin_sign = (-1) ** spin
+
     for t, theta in enumerate(thetas):
-        phi_ring_offset = (
-            samples.p2phi_ring(t, 0, nside) if sampling.lower() == "healpix" else 0
+        phase_shifts = (
+            samples.ring_phase_shift_hp(L, t, nside, False)
+            if sampling.lower() == "healpix"
+            else np.ones(2 * L - 1)
         )
 
         for el in range(max(L_lower, abs(spin)), L):
             dl = recursions.turok.compute_slice(theta, el, L, -spin, reality)
 
-            elfactor = np.sqrt((2 * el + 1) / (4 * np.pi))
+            elfactor = spin_sign * elfactors[el]
 
             m_start_ind = 0 if reality else -el
             for m in range(m_start_ind, el + 1):
-                phase_shift = (
-                    np.exp(1j * m * phi_ring_offset)
-                    if sampling.lower() == "healpix"
-                    else 1
-                )
-
                 val = (
-                    (-1) ** spin
-                    * elfactor
+                    elfactor
                     * dl[m + L - 1]
                     * flm[el, m + L - 1]
-                    * phase_shift
+                    * phase_shifts[m + L - 1]
                 )
 
                 if reality and sampling.lower() == "healpix":
@@ -524,14 +555,19 @@ def _compute_inverse_sov_fft(
         f = hp.healpix_ifft(ftm, L, nside, "numpy", reality)
     else:
         if reality:
-            f = np.fft.irfft(
+            f = sfft.irfft(
                 ftm[:, L - 1 + m_offset :],
                 samples.nphi_equiang(L, sampling),
                 axis=1,
                 norm="forward",
             )
         else:
-            f = np.fft.ifft(np.fft.ifftshift(ftm, axes=1), axis=1, norm="forward")
+            f = sfft.ifft(
+                np.fft.ifftshift(ftm, axes=1),
+                axis=1,
+                norm="forward",
+                overwrite_x=True,
+            )
 
     return f
 
@@ -545,6 +581,7 @@ def _compute_inverse_sov_fft_vectorized(
     nside: int,
     reality: bool,
     L_lower: int,
+    dtype: np.dtype = np.complex128,
 ):
     r"""
     A vectorized function to compute inverse spherical harmonic transform by
@@ -571,12 +608,22 @@ def _compute_inverse_sov_fft_vectorized(
         L_lower (int): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`.  Defaults to 0.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Signal on the sphere.
 
     """
-    ftm = np.zeros(samples.ftm_shape(L, sampling, nside), dtype=np.complex128)
+    ftm = np.zeros(samples.ftm_shape(L, sampling, nside), dtype=dtype)
     m_offset = 1 if sampling in ["mwss", "healpix"] else 0
+    m_start_ind = L - 1 if reality else 0
+
+    # Fold normalisation into the harmonic coefficients once, so that the sum over
+    # el for each ring reduces to a single contraction against the Wigner-d slices.
+    elfactors = np.sqrt((2 * np.arange(L) + 1) / (4 * np.pi))
+    flm_scaled = np.einsum("lm,l->lm", flm[:, m_start_ind:], elfactors).astype(dtype)
+    dl = np.zeros((L, 2 * L - 1 - m_start_ind), dtype=np.finfo(dtype).dtype)
 
     for t, theta in enumerate(thetas):
         phase_shift = (
@@ -586,28 +633,34 @@ def _compute_inverse_sov_fft_vectorized(
         )
 
         for el in range(max(L_lower, abs(spin)), L):
-            dl = recursions.turok.compute_slice(theta, el, L, -spin, reality)
-            elfactor = np.sqrt((2 * el + 1) / (4 * np.pi))
-            m_start_ind = L - 1 if reality else 0
-            val = elfactor * dl[m_start_ind:] * flm[el, m_start_ind:] * phase_shift
-            if reality and sampling.lower() == "healpix":
-                ftm[t, m_offset : L - 1 + m_offset] += np.flip(np.conj(val[1:]))
+            dl[el] = recursions.turok.compute_slice(theta, el, L, -spin, reality)[
+                m_start_ind:
+            ]
+
+        val = np.einsum("lm,lm->m", dl, flm_scaled) * phase_shift
+        if reality and sampling.lower() == "healpix":
+            ftm[t, m_offset : L - 1 + m_offset] = np.flip(np.conj(val[1:]))
 
-            ftm[t, m_start_ind + m_offset : 2 * L - 1 + m_offset] += val
+        ftm[t, m_start_ind + m_offset : 2 * L - 1 + m_offset] = val
 
     ftm *= (-1) ** (spin)
     if sampling.lower() == "healpix":
         f = hp.healpix_ifft(ftm, L, nside, "numpy", reality)
     else:
         if reality:
-            f = np.fft.irfft(
+            f = sfft.irfft(
                 ftm[:, L - 1 + m_offset :],
                 samples.nphi_equiang(L, sampling),
                 axis=1,
                 norm="forward",
             )
         else:
-            f = np.fft.ifft(np.fft.ifftshift(ftm, axes=1), axis=1, norm="forward")
+            f = sfft.ifft(
+                np.fft.ifftshift(ftm, axes=1),
+                axis=1,
+                norm="forward",
+                overwrite_x=True,
+            )
 
     return f
 
@@ -622,6 +675,7 @@ def _compute_forward_direct(
     nside: int,
     reality: bool,
     L_lower: int,
+    dtype: np.dtype = np.complex128,
 ):
     r"""
     Compute forward spherical harmonic transform directly.
@@ -649,56 +703,57 @@ def _compute_forward_direct(
         L_lower (int): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`.  Defaults to 0.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Spherical harmonic coefficients.
 
     """
-    flm = np.zeros(samples.flm_shape(L), dtype=np.complex128)
+    flm = np.zeros(samples.flm_shape(L), dtype=dtype)
 
     if sampling.lower() != "healpix":
         phis_ring = samples.phis_equiang(L, sampling)
 
+    elfactors = np.sqrt((2 * np.arange(L) + 1) / (4 * np.pi))
+    spin_sign = (-1) ** spin
+
+    ms = np.arange(-L + 1, L)
+
     for t, theta in enumerate(thetas):
         if sampling.lower() == "healpix":
             phis_ring = samples.phis_ring(t, nside)
+            f_ring = f[[samples.hp_ang2pix(nside, theta, phi) for phi in phis_ring]]
+        else:
+            f_ring = f[t]
+
+        # Harmonics exp(-i m phi) evaluated at every sample of the ring.
+        exps = np.exp(-1j * np.outer(ms, phis_ring))
 
         for el in range(max(L_lower, abs(spin)), L):
             dl = recursions.turok.compute_slice(theta, el, L, -spin, reality)
 
-            elfactor = np.sqrt((2 * el + 1) / (4 * np.pi))
-
-            for p, phi in enumerate(phis_ring):
-                if sampling.lower() != "healpix":
-                    entry = (t, p)
-                else:
-                    entry = samples.hp_ang2pix(nside, theta, phi)
-
-                if reality:
-                    flm[el, L - 1] += (
-                        weights[t] * (-1) ** spin * elfactor * dl[L - 1] * f[entry]
-                    )  # m = 0
-                    for m in range(1, el + 1):
-                        val = (
-                            weights[t]
-                            * (-1) ** spin
-                            * elfactor
-                            * np.exp(-1j * m * phi)
-                            * dl[m + L - 1]
-                            * f[entry]
-                        )
-                        flm[el, m + L - 1] += val
-                        flm[el, -m + L - 1] += (-1) ** m * np.conj(val)
-
-                else:
-                    for m in range(-el, el + 1):
-                        flm[el, m + L - 1] += (
-                            weights[t]
-                            * (-1) ** spin
-                            * elfactor
-                            * np.exp(-1j * m * phi)
-                            * dl[m + L - 1]
-                            * f[entry]
-                        )
+            elfactor = spin_sign * elfactors[el]
+
+            if reality:
+                vals = (
+                    weights[t]
+                    * elfactor
+                    * dl[L - 1 : L + el]
+                    * (exps[L - 1 : L + el] @ f_ring)
+                )
+                flm[el, L - 1 : L + el] += vals
+                flm[el, L - 1 - el : L - 1] += np.flip(
+                    (-1) ** ms[L : L + el] * np.conj(vals[1:])
+                )
+
+            else:
+                flm[el, L - 1 - el : L + el] += (
+                    weights[t]
+                    * elfactor
+                    * dl[L - 1 - el : L + el]
+                    * (exps[L - 1 - el : L + el] @ f_ring)
+                )
 
     return flm
 
@@ -713,6 +768,7 @@ def _compute_forward_sov(
     nside: int,
     reality: bool,
     L_lower: int,
+    dtype: np.dtype = np.complex128,
 ):
     r"""
     Compute forward spherical harmonic transform by separation of variables with a
@@ -741,6 +797,9 @@ def _compute_forward_sov(
         L_lower (int): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`.  Defaults to 0.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Spherical harmonic coefficients.
 
@@ -748,7 +807,10 @@ def _compute_forward_sov(
     if sampling.lower() != "healpix":
         phis_ring = samples.phis_equiang(L, sampling)
 
-    ftm = np.zeros((len(thetas), 2 * L - 1), dtype=np.complex128)
+    ftm = np.zeros((len(thetas), 2 * L - 1), dtype=dtype)
+    elfactors = np.sqrt((2 * np.arange(L) + 1) / (4 * np.pi))
+    spin_sign = (-1) ** spin
+
     for t, theta in enumerate(thetas):
         if sampling.lower() == "healpix":
             phis_ring = samples.phis_ring(t, nside)
@@ -763,37 +825,27 @@ def _compute_forward_sov(
             for m in range(m_start_ind, L):
                 ftm[t, m + L - 1] += np.exp(-1j * m * phi) * f[entry]
 
-    flm = np.zeros(samples.flm_shape(L), dtype=np.complex128)
+    flm = np.zeros(samples.flm_shape(L), dtype=dtype)
 
     for t, theta in enumerate(thetas):
         for el in range(max(L_lower, abs(spin)), L):
             dl = recursions.turok.compute_slice(theta, el, L, -spin, reality)
 
-            elfactor = np.sqrt((2 * el + 1) / (4 * np.pi))
+            elfactor = spin_sign * elfactors[el]
 
             if reality:
                 flm[el, L - 1] += (
-                    weights[t] * (-1) ** spin * elfactor * dl[L - 1] * ftm[t, L - 1]
+                    weights[t] * elfactor * dl[L - 1] * ftm[t, L - 1]
                 )  # m = 0
                 for m in range(1, el + 1):
-                    val = (
-                        weights[t]
-                        * (-1) ** spin
-                        * elfactor
-                        * dl[m + L - 1]
-                        * ftm[t, m + L - 1]
-                    )
+                    val = weights[t] * elfactor * dl[m + L - 1] * ftm[t, m + L - 1]
                     flm[el, m + L - 1] += val
                     flm[el, -m + L - 1] += (-1) ** m * np.conj(val)
 
             else:
                 for m in range(-el, el + 1):
                     flm[el, m + L - 1] += (
-                        weights[t]
-                        * (-1) ** spin
-                        * elfactor
-                        * dl[m + L - 1]
-                        * ftm[t, m + L - 1]
+                        weights[t] * elfactor * dl[m + L - 1] * ftm[t, m + L - 1]
                     )
 
     return flm
@@ -809,6 +861,7 @@ def _compute_forward_sov_fft(
     nside: int,
     reality: bool,
     L_lower: int,
+    dtype: np.dtype = np.complex128,
 ):
     r"""
     Compute forward spherical harmonic transform by separation of variables with a
@@ -837,12 +890,15 @@ def _compute_forward_sov_fft(
         L_lower (int): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`.  Defaults to 0.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Spherical harmonic coefficients.
 
     """
-    flm = np.zeros(samples.flm_shape(L), dtype=np.complex128)
-    ftm = np.zeros_like(f).astype(np.complex128)
+    flm = np.zeros(samples.flm_shape(L), dtype=dtype)
+    ftm = np.zeros_like(f).astype(dtype)
 
     m_offset = 1 if sampling in ["mwss", "healpix"] else 0
 
@@ -850,7 +906,7 @@ def _compute_forward_sov_fft(
         ftm = hp.healpix_fft(f, L, nside, "numpy", reality)
     else:
         if reality:
-            ftm_temp = np.fft.rfft(
+            ftm_temp = sfft.rfft(
                 np.real(f),
                 axis=1,
                 norm="backward",
@@ -859,57 +915,45 @@ def _compute_forward_sov_fft(
                 ftm_temp = ftm_temp[:, :-1]
             ftm[:, L - 1 + m_offset :] = ftm_temp
         else:
-            ftm = np.fft.fftshift(np.fft.fft(f, axis=1, norm="backward"), axes=1)
+            ftm = np.fft.fftshift(sfft.fft(f, axis=1, norm="backward"), axes=1)
+
+    elfactors = np.sqrt((2 * np.arange(L) + 1) / (4 * np.pi))
+    spin_sign = (-1) ** spin
 
     for t, theta in enumerate(thetas):
-        phi_ring_offset = (
-            samples.p2phi_ring(t, 0, nside) if sampling.lower() == "healpix" else 0
+        phase_shifts = (
+            samples.ring_phase_shift_hp(L, t, nside, True)
+            if sampling.lower() == "healpix"
+            else np.ones(2 * L - 1)
         )
 
         for el in range(max(L_lower, abs(spin)), L):
             dl = recursions.turok.compute_slice(theta, el, L, -spin, reality)
 
-            elfactor = np.sqrt((2 * el + 1) / (4 * np.pi))
+            elfactor = spin_sign * elfactors[el]
 
             if reality:
                 flm[el, L - 1] += (
-                    weights[t]
-                    * (-1) ** spin
-                    * elfactor
-                    * dl[L - 1]
-                    * ftm[t, L - 1 + m_offset]
+                    weights[t] * elfactor * dl[L - 1] * ftm[t, L - 1 + m_offset]
                 )
                 for m in range(1, el + 1):
-                    phase_shift = (
-                        np.exp(-1j * m * phi_ring_offset)
-                        if sampling.lower() == "healpix"
-                        else 1
-                    )
-
                     val = (
                         weights[t]
-                        * (-1) ** spin
                         * elfactor
                         * dl[m + L - 1]
                         * ftm[t, m + L - 1 + m_offset]
-                        * phase_shift
+                        * phase_shifts[m + L - 1]
                     )
                     flm[el, m + L - 1] += val
                     flm[el, -m + L - 1] += (-1) ** m * np.conj(val)
             else:
                 for m in range(-el, el + 1):
-                    phase_shift = (
-                        np.exp(-1j * m * phi_ring_offset)
-                        if sampling.lower() == "healpix"
-                        else 1
-                    )
                     flm[el, m + L - 1] += (
                         weights[t]
-                        * (-1) ** spin
                         * elfactor
                         * dl[m + L - 1]
                         * ftm[t, m + L - 1 + m_offset]
-                        * phase_shift
+                        * phase_shifts[m + L - 1]
                     )
 
     return flm
@@ -925,6 +969,7 @@ def _compute_forward_sov_fft_vectorized(
     nside: int,
     reality: bool,
     L_lower: int,
+    dtype: np.dtype = np.complex128,
 ):
     r"""
     A vectorized function to compute forward spherical harmonic transform by
@@ -953,12 +998,15 @@ def _compute_forward_sov_fft_vectorized(
         L_lower (int): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`.  Defaults to 0.
 
+        dtype (np.dtype, optional): Complex dtype of the working arrays and of the
+            result.  Defaults to np.complex128.
+
     Returns:
         np.ndarray: Spherical harmonic coefficients.
 
     """
-    flm = np.zeros(samples.flm_shape(L), dtype=np.complex128)
-    ftm = np.zeros_like(f).astype(np.complex128)
+    flm = np.zeros(samples.flm_shape(L), dtype=dtype)
+    ftm = np.zeros_like(f).astype(dtype)
 
     m_offset = 1 if sampling in ["mwss", "healpix"] else 0
     if reality:
@@ -968,7 +1016,7 @@ def _compute_forward_sov_fft_vectorized(
         ftm = hp.healpix_fft(f, L, nside, "numpy", reality)
     else:
         if reality:
-            t = np.fft.rfft(
+            t = sfft.rfft(
                 np.real(f),
                 axis=1,
                 norm="backward",
@@ -977,8 +1025,14 @@ def _compute_forward_sov_fft_vectorized(
                 t = t[:, :-1]
             ftm[:, L - 1 + m_offset :] = t
         else:
-            ftm = np.fft.fftshift(np.fft.fft(f, axis=1, norm="backward"), axes=1)
+            ftm = np.fft.fftshift(sfft.fft(f, axis=1, norm="backward"), axes=1)
+
+    m_start_ind = L - 1 if reality else 0
+    dl = np.zeros((L, 2 * L - 1 - m_start_ind), dtype=np.finfo(dtype).dtype)
 
+    # Each ring contributes independently to every (el, m), so accumulate its whole
+    # block at once and apply the el normalisation and conjugate symmetry after the
+    # reduction over rings.
     for t, theta in enumerate(thetas):
         phase_shift = (
             samples.ring_phase_shift_hp(L, t, nside, True, reality)
@@ -987,24 +1041,22 @@ def _compute_forward_sov_fft_vectorized(
         )
 
         for el in range(max(L_lower, abs(spin)), L):
-            dl = recursions.turok.compute_slice(theta, el, L, -spin, reality)
-
-            elfactor = np.sqrt((2 * el + 1) / (4 * np.pi))
+            dl[el] = recursions.turok.compute_slice(theta, el, L, -spin, reality)[
+                m_start_ind:
+            ]
+
+        flm[:, m_start_ind:] += (
+            weights[t]
+            * dl
+            * (ftm[t, m_start_ind + m_offset : 2 * L - 1 + m_offset] * phase_shift)
+        )
 
-            m_start_ind = L - 1 if reality else 0
-            flm[el, m_start_ind:] += (
-                weights[t]
-                * elfactor
-                * np.multiply(
-                    dl[m_start_ind:],
-                    ftm[t, m_start_ind + m_offset : 2 * L - 1 + m_offset],
-                )
-                * phase_shift
-            )
-            if reality:
-                flm[el, :m_start_ind] = np.flip(
-                    m_conj * np.conj(flm[el, m_start_ind + 1 :])
-                )
+    elfactors = np.sqrt((2 * np.arange(L) + 1) / (4 * np.pi))
+    flm[:, m_start_ind:] = np.einsum("lm,l->lm", flm[:, m_start_ind:], elfactors)
+    if reality:
+        flm[:, :m_start_ind] = np.flip(
+            m_conj * np.conj(flm[:, m_start_ind + 1 :]), axis=1
+        )
 
     flm *= (-1) ** spin
 
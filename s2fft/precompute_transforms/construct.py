@@ -92,13 +92,8 @@ def spin_spherical_kernel(
     # - The complexity of this approach is O(L^3).
     # - This approach becomes inaccurate for abs(spins) >= 5.
     if recursion.lower() == "price-mcewen":
-        dl = np.zeros((len(thetas), L, m_dim), dtype=np.float64)
-        for t, theta in enumerate(thetas):
-            for el in range(abs(spin), L):
-                dl[t, el] = recursions.turok.compute_slice(
-                    theta, el, L, -spin, reality
-                )[m_start_ind:]
-                dl[t, el] *= np.sqrt((2 * el + 1) / (4 * np.pi))
+        dl = _price_mcewen_kernel(thetas, L, spin, sampling, forward, nside)
+        dl = np.ascontiguousarray(dl[:, :, m_start_ind:])
 
     # Calculate Wigner d-function elements through the Risbo recursion.
     elif recursion.lower() == "risbo":
@@ -109,11 +104,20 @@ def spin_spherical_kernel(
         # manually bootstrapped from the recursion.
         # - The complexity of this approach is O(L^4).
         # - This approach is stable for arbitrary abs(spins) <= L.
+        # Rings are symmetric about the equator, so the recursion is only run for
+        # theta <= pi/2 and the remaining rings are mirrored.
         if sampling.lower() in ["healpix", "gl"]:
-            delta = np.zeros((len(thetas), 2 * L - 1, 2 * L - 1), dtype=np.float64)
+            n_half = _n_recursed_thetas(thetas)
+            n_mirror = len(thetas) - n_half
+            delta = np.zeros((n_half, 2 * L - 1, 2 * L - 1), dtype=np.float64)
             for el in range(L):
-                delta = recursions.risbo.compute_full_vectorised(delta, thetas, L, el)
-                dl[:, el] = delta[:, m_start_ind:, L - 1 - spin]
+                delta = recursions.risbo.compute_full_vectorised(
+                    delta, thetas[:n_half], L, el
+                )
+                dl[:n_half, el] = delta[:, m_start_ind:, L - 1 - spin]
+                dl[n_half:, el] = _mirror_thetas(delta, n_mirror, el)[
+                    :, m_start_ind:, L - 1 - spin
+                ]
 
         # MW, MWSS, and DH sampling ARE uniform in theta therefore CAN be calculated
         # using the Fourier decomposition of Wigner d-functions.
@@ -133,16 +137,18 @@ def spin_spherical_kernel(
             m_value = np.arange(-L + 1, L)
             for el in range(L):
                 delta = recursions.risbo.compute_full(delta, np.pi / 2, L, el)
+                # Lay out the Fourier index last so the FFT runs along the
+                # contiguous axis.
                 temp = np.einsum(
-                    "am,a,m->am",
-                    delta[:, m_start_ind:],
-                    delta[:, L - 1 - spin],
+                    "am,a,m,a->ma",
+                    delta[L - 1 :, m_start_ind:],
+                    delta[L - 1 :, L - 1 - spin],
                     1j ** (-spin - m_value[m_start_ind:]),
+                    np.exp(1j * m_value[L - 1 :] * thetas[0]),
                 )
-                temp = np.einsum("am,a->am", temp, np.exp(1j * m_value * thetas[0]))
-                temp = np.fft.irfft(temp[L - 1 :], n=nsamps, axis=0, norm="forward")
+                temp = np.fft.irfft(temp, n=nsamps, axis=-1, norm="forward")
 
-                dl[:, el] = temp[: len(thetas)]
+                dl[:, el] = temp[:, : len(thetas)].T
 
         # Fold in normalisation to avoid recomputation at run-time.
         dl = np.einsum("tlm,l->tlm", dl, np.sqrt((2 * np.arange(L) + 1) / (4 * np.pi)))
@@ -269,14 +275,23 @@ def spin_spherical_kernel_jax(
         # manually bootstrapped from the recursion.
         # - The complexity of this approach is O(L^4).
         # - This approach is stable for arbitrary abs(spins) <= L.
+        # Rings are symmetric about the equator, so the recursion is only run for
+        # theta <= pi/2 and the remaining rings are mirrored.
         if sampling.lower() in ["healpix", "gl"]:
-            delta = jnp.zeros((len(thetas), 2 * L - 1, 2 * L - 1), dtype=jnp.float64)
+            n_half = _n_recursed_thetas(thetas)
+            n_mirror = len(thetas) - n_half
+            delta = jnp.zeros((n_half, 2 * L - 1, 2 * L - 1), dtype=jnp.float64)
             vfunc = jax.vmap(
                 recursions.risbo_jax.compute_full, in_axes=(0, 0, None, None)
             )
             for el in range(L):
-                delta = vfunc(delta, thetas, L, el)
-                dl = dl.at[:, el].set(delta[:, m_start_ind:, L - 1 - spin])
+                delta = vfunc(delta, thetas[:n_half], L, el)
+                dl = dl.at[:n_half, el].set(delta[:, m_start_ind:, L - 1 - spin])
+                dl = dl.at[n_half:, el].set(
+                    _mirror_thetas_jax(delta, n_mirror, el)[
+                        :, m_start_ind:, L - 1 - spin
+                    ]
+                )
 
         # MW, MWSS, and DH sampling ARE uniform in theta therefore CAN be calculated
         # using the Fourier decomposition of Wigner d-functions.
@@ -407,11 +422,20 @@ def wigner_kernel(
     # manually calculated from the recursion.
     # - The complexity of this approach is ALWAYS O(L^4).
     # - This approach is stable for arbitrary abs(spins) <= L.
+    # When rings are symmetric about the equator the recursion is only run for
+    # theta <= pi/2 and the remaining rings are mirrored.
     if mode.lower() == "direct":
-        delta = np.zeros((len(thetas), 2 * L - 1, 2 * L - 1), dtype=np.float64)
+        n_half = _n_recursed_thetas(thetas)
+        n_mirror = len(thetas) - n_half
+        delta = np.zeros((n_half, 2 * L - 1, 2 * L - 1), dtype=np.float64)
         for el in range(L):
-            delta = recursions.risbo.compute_full_vectorised(delta, thetas, L, el)
-            dl[:, :, el] = np.moveaxis(delta, -1, 0)[L - 1 + n]
+            delta = recursions.risbo.compute_full_vectorised(
+                delta, thetas[:n_half], L, el
+            )
+            dl[:, :n_half, el] = np.moveaxis(delta, -1, 0)[L - 1 + n]
+            dl[:, n_half:, el] = np.moveaxis(
+                _mirror_thetas(delta, n_mirror, el), -1, 0
+            )[L - 1 + n]
 
     # MW, MWSS, and DH sampling ARE uniform in theta therefore CAN be calculated
     # using the Fourier decomposition of Wigner d-functions.
@@ -432,16 +456,17 @@ def wigner_kernel(
         # Calculate the Fourier coefficients of the Wigner d-functions, delta(pi/2).
         for el in range(L):
             delta = recursions.risbo.compute_full(delta, np.pi / 2, L, el)
+            # Lay out the Fourier index last so the FFT runs along the contiguous axis.
             temp = np.einsum(
-                "am,an,m,n->amn",
-                delta,
-                delta[:, L - 1 + n],
+                "am,an,m,n,a->nma",
+                delta[L - 1 :],
+                delta[L - 1 :, L - 1 + n],
                 1j ** (-m_value),
                 1j ** (n),
+                np.exp(1j * m_value[L - 1 :] * thetas[0]),
             )
-            temp = np.einsum("amn,a->amn", temp, np.exp(1j * m_value * thetas[0]))
-            temp = np.fft.irfft(temp[L - 1 :], n=nsamps, axis=0, norm="forward")
-            dl[:, :, el] = np.moveaxis(temp[: len(thetas)], -1, 0)
+            temp = np.fft.irfft(temp, n=nsamps, axis=-1, norm="forward")
+            dl[:, :, el] = np.swapaxes(temp[..., : len(thetas)], -1, -2)
 
     else:
         raise ValueError(f"Recursion method {mode} not recognised.")
@@ -546,12 +571,19 @@ def wigner_kernel_jax(
     # manually calculated from the recursion.
     # - The complexity of this approach is ALWAYS O(L^4).
     # - This approach is stable for arbitrary abs(spins) <= L.
+    # When rings are symmetric about the equator the recursion is only run for
+    # theta <= pi/2 and the remaining rings are mirrored.
     if mode.lower() == "direct":
-        delta = jnp.zeros((len(thetas), 2 * L - 1, 2 * L - 1), dtype=jnp.float64)
+        n_half = _n_recursed_thetas(thetas)
+        n_mirror = len(thetas) - n_half
+        delta = jnp.zeros((n_half, 2 * L - 1, 2 * L - 1), dtype=jnp.float64)
         vfunc = jax.vmap(recursions.risbo_jax.compute_full, in_axes=(0, 0, None, None))
         for el in range(L):
-            delta = vfunc(delta, thetas, L, el)
-            dl = dl.at[:, :, el].set(jnp.moveaxis(delta, -1, 0)[L - 1 + n])
+            delta = vfunc(delta, thetas[:n_half], L, el)
+            dl = dl.at[:, :n_half, el].set(jnp.moveaxis(delta, -1, 0)[L - 1 + n])
+            dl = dl.at[:, n_half:, el].set(
+                jnp.moveaxis(_mirror_thetas_jax(delta, n_mirror, el), -1, 0)[L - 1 + n]
+            )
 
     # MW, MWSS, and DH sampling ARE uniform in theta therefore CAN be calculated
     # using the Fourier decomposition of Wigner d-functions.
@@ -689,3 +721,133 @@ def healpix_phase_shifts(L: int, nside: int, forward: bool = False) -> np.ndarra
         phase_array[t] = samples.ring_phase_shift_hp(L, t, nside, forward)
 
     return phase_array
+
+
+def _n_recursed_thetas(thetas: np.ndarray) -> int:
+    r"""
+    Number of leading rings for which Wigner d-functions must be recursed directly.
+
+    When the sample rings are symmetric about the equator, i.e. :math:`\theta_{T-1-t}
+    = \pi - \theta_t`, only rings with :math:`\theta \leq \pi/2` are required, the
+    others being recovered by symmetry.
+
+    Args:
+        thetas (np.ndarray): Vector of sample positions in :math:`\theta` on the sphere.
+
+    Returns:
+        int: Number of rings to recurse.
+
+    """
+    thetas = np.asarray(thetas)
+    if np.allclose(thetas[::-1], np.pi - thetas):
+        return (len(thetas) + 1) // 2
+    return len(thetas)
+
+
+def _mirror_thetas(delta: np.ndarray, n_mirror: int, el: int) -> np.ndarray:
+    r"""
+    Wigner d-functions on the rings mirrored about the equator, from
+    :math:`d^\ell_{m,n}(\pi - \theta) = (-1)^{\ell+m} d^\ell_{m,-n}(\theta)`.
+
+    Args:
+        delta (np.ndarray): Wigner d-functions :math:`d^\ell_{m,n}(\theta_t)` of
+            dimension :math:`[n_{\theta}, 2L-1, 2L-1]` for the recursed rings.
+
+        n_mirror (int): Number of leading recursed rings to mirror.
+
+        el (int): Harmonic degree :math:`\ell`.
+
+    Returns:
+        np.ndarray: Wigner d-functions :math:`d^\ell_{m,n}(\pi - \theta_t)` of
+        dimension :math:`[n_{mirror}, 2L-1, 2L-1]`, ordered by increasing
+        :math:`\pi - \theta_t`.
+
+    """
+    L = (delta.shape[-1] + 1) // 2
+    m_value = np.arange(-L + 1, L)
+    return np.einsum(
+        "m,tmn->tmn", (-1.0) ** (el + m_value), delta[:n_mirror][::-1, :, ::-1]
+    )
+
+
+def _mirror_thetas_jax(delta: jnp.ndarray, n_mirror: int, el: int) -> jnp.ndarray:
+    r"""
+    Wigner d-functions on the rings mirrored about the equator, from
+    :math:`d^\ell_{m,n}(\pi - \theta) = (-1)^{\ell+m} d^\ell_{m,-n}(\theta)`. JAX
+    implementation of :func:`~_mirror_thetas`.
+
+    Args:
+        delta (jnp.ndarray): Wigner d-functions :math:`d^\ell_{m,n}(\theta_t)` of
+            dimension :math:`[n_{\theta}, 2L-1, 2L-1]` for the recursed rings.
+
+        n_mirror (int): Number of leading recursed rings to mirror.
+
+        el (int): Harmonic degree :math:`\ell`.
+
+    Returns:
+        jnp.ndarray: Wigner d-functions :math:`d^\ell_{m,n}(\pi - \theta_t)` of
+        dimension :math:`[n_{mirror}, 2L-1, 2L-1]`, ordered by increasing
+        :math:`\pi - \theta_t`.
+
+    """
+    L = (delta.shape[-1] + 1) // 2
+    m_value = jnp.arange(-L + 1, L)
+    return jnp.einsum(
+        "m,tmn->tmn", (-1.0) ** (el + m_value), delta[:n_mirror][::-1, :, ::-1]
+    )
+
+
+def _price_mcewen_kernel(
+    thetas: np.ndarray,
+    L: int,
+    spin: int,
+    sampling: str,
+    forward: bool,
+    nside: int,
+) -> np.ndarray:
+    r"""
+    Normalised Wigner d-functions :math:`d^\ell_{m,-s}(\theta)` for all thetas,
+    :math:`\ell` and :math:`m`, evaluated through the Price-McEwen recursion.
+
+    Args:
+        thetas (np.ndarray): Vector of sample positions in :math:`\theta` on the sphere.
+
+        L (int): Harmonic band-limit.
+
+        spin (int): Harmonic spin.
+
+        sampling (str): Sampling scheme.
+
+        forward (bool): Whether to provide forward or inverse shift.
+
+        nside (int): HEALPix Nside resolution parameter.
+
+    Returns:
+        np.ndarray: Wigner d-functions of dimension :math:`[n_{\theta}, L, 2L-1]`.
+
+    """
+    # All Wigner d-functions d^l_{m,-spin} vanish for abs(spin) >= L.
+    if abs(spin) >= L:
+        return np.zeros((len(thetas), L, 2 * L - 1), dtype=np.float64)
+
+    # Advance the recursion for all thetas and el simultaneously.
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        dl = recursions.price_mcewen.compute_all_slices(
+            thetas, L, spin, sampling, forward, nside
+        )
+    dl[np.isnan(dl)] = 0
+    dl = np.swapaxes(dl, 0, 2)
+    dl = np.swapaxes(dl, 0, 1)
+
+    # North pole singularity
+    if sampling.lower() == "mwss":
+        dl[0] = 0
+        dl[0, :, L - 1 - spin] = 1
+
+    # South pole singularity
+    if sampling.lower() in ["mw", "mwss"]:
+        dl[-1] = 0
+        dl[-1, :, L - 1 + spin] = (-1.0) ** (np.arange(L) - spin)
+    dl[:, : abs(spin)] = 0
+
+    return np.einsum("tlm,l->tlm", dl, np.sqrt((2 * np.arange(L) + 1) / (4 * np.pi)))
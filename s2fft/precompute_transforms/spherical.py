@@ -1,11 +1,11 @@
-from functools import partial
-from typing import Optional
+from functools import lru_cache, partial
+from typing import Optional, Union
 from warnings import warn
 
 import jax.numpy as jnp
 import numpy as np
 import torch
-from jax import jit
+from jax import ensure_compile_time_eval, jit
 
 from s2fft.precompute_transforms import construct
 from s2fft.sampling import s2_samples as samples
@@ -38,7 +38,11 @@ def inverse(
 
         spin (int, optional): Harmonic spin. Defaults to 0.
 
-        kernel (np.ndarray, optional): Wigner-d kernel. Defaults to None.
+        kernel (np.ndarray, optional): Wigner-d kernel. Defaults to None, in which
+            case the kernel is constructed and cached for reuse by subsequent calls
+            with the same parameters (see :func:`clear_kernel_cache`).  For
+            method="torch" the kernel is built on the device of `flm`, so the
+            transform may be run on a GPU.
 
         sampling (str, optional): Sampling scheme.  Supported sampling schemes include
             {"mw", "mwss", "dh", "gl", "healpix"}. Defaults to "mw".
@@ -78,11 +82,9 @@ def inverse(
         "spin": spin,
         "nside": nside,
     }
-    kernel = (
-        _kernel_functions[method](forward=False, **common_kwargs)
-        if kernel is None
-        else kernel
-    )
+    if kernel is None:
+        device = flm.device if method == "torch" else None
+        kernel = _cached_kernel(method, False, device, **common_kwargs)
     return _inverse_functions[method](flm, kernel, **common_kwargs)
 
 
@@ -260,7 +262,11 @@ def inverse_transform_torch(
     m_offset = 1 if sampling in ["mwss", "healpix"] else 0
     m_start_ind = L - 1 if reality else 0
 
-    ftm = torch.zeros(samples.ftm_shape(L, sampling, nside), dtype=torch.complex128)
+    ftm = torch.zeros(
+        samples.ftm_shape(L, sampling, nside),
+        dtype=torch.complex128,
+        device=flm.device,
+    )
     if sampling.lower() == "healpix":
         ftm[:, m_start_ind + m_offset :] += torch.einsum(
             "...tlm, ...lm -> ...tm", kernel, flm[:, m_start_ind:]
@@ -321,7 +327,11 @@ def forward(
 
         spin (int, optional): Harmonic spin. Defaults to 0.
 
-        kernel (np.ndarray, optional): Wigner-d kernel. Defaults to None.
+        kernel (np.ndarray, optional): Wigner-d kernel. Defaults to None, in which
+            case the kernel is constructed and cached for reuse by subsequent calls
+            with the same parameters (see :func:`clear_kernel_cache`).  For
+            method="torch" the kernel is built on the device of `f`, so the
+            transform may be run on a GPU.
 
         sampling (str, optional): Sampling scheme.  Supported sampling schemes include
             {"mw", "mwss", "dh", "gl", "healpix"}. Defaults to "mw".
@@ -367,15 +377,13 @@ def forward(
         "spin": spin,
         "nside": nside,
     }
-    kernel = (
-        _kernel_functions[method](forward=True, **common_kwargs)
-        if kernel is None
-        else kernel
-    )
+    device = f.device if method == "torch" else None
+    if kernel is None:
+        kernel = _cached_kernel(method, True, device, **common_kwargs)
     if iter == 0:
         return _forward_functions[method](f, kernel, **common_kwargs)
     else:
-        inverse_kernel = _kernel_functions[method](forward=False, **common_kwargs)
+        inverse_kernel = _cached_kernel(method, False, device, **common_kwargs)
         return iterative_refinement.forward_with_iterative_refinement(
             f=f,
             n_iter=iter,
@@ -590,7 +598,7 @@ def forward_transform_torch(
             ftm = torch.fft.fft(f, axis=-1, norm="backward")
             ftm = torch.fft.fftshift(ftm, dim=[-1])[:, m_offset:]
 
-    flm = torch.zeros(samples.flm_shape(L), dtype=torch.complex128)
+    flm = torch.zeros(samples.flm_shape(L), dtype=torch.complex128, device=f.device)
     if sampling.lower() == "healpix":
         flm[:, m_start_ind:] = torch.einsum("...tlm, ...tm -> ...lm", kernel, ftm)
     else:
@@ -603,7 +611,8 @@ def forward_transform_torch(
 
     if reality:
         flm[:, :m_start_ind] = torch.flip(
-            (-1) ** (torch.arange(1, L) % 2) * torch.conj(flm[:, m_start_ind + 1 :]),
+            (-1) ** (torch.arange(1, L, device=f.device) % 2)
+            * torch.conj(flm[:, m_start_ind + 1 :]),
             dims=[-1],
         )
 
@@ -628,3 +637,71 @@ _kernel_functions = {
     "jax": construct.spin_spherical_kernel_jax,
     "torch": partial(construct.spin_spherical_kernel, using_torch=True),
 }
+
+
+def clear_kernel_cache() -> None:
+    r"""
+    Release the Wigner-d kernels cached by :func:`forward` and :func:`inverse` when
+    called without an explicit kernel.
+
+    At most the two most recently used kernels (e.g. a forward and inverse pair) are
+    retained, but each has :math:`\mathcal{O}(L^3)` memory overhead.
+    """
+    _cached_kernel.cache_clear()
+
+
+@lru_cache(maxsize=2)
+def _cached_kernel(
+    method: str,
+    forward: bool,
+    device: Optional[torch.device],
+    L: int,
+    sampling: str,
+    reality: bool,
+    spin: int,
+    nside: Optional[int],
+) -> Union[np.ndarray, jnp.ndarray, torch.Tensor]:
+    r"""
+    Construct the Wigner-d kernel for a given configuration, reusing the kernel built
+    by any previous call with identical arguments.
+
+    Kernels depend only on static parameters, so they are always evaluated eagerly
+    (even when called under a JAX trace) to keep the cached values concrete. Cached
+    NumPy kernels are marked read-only.
+
+    Args:
+        method (str): Execution mode in {"numpy", "jax", "torch"}.
+
+        forward (bool): Whether to construct the forward or inverse kernel.
+
+        device (torch.device, optional): Device on which to place the kernel for
+            method="torch", otherwise None.
+
+        L (int): Harmonic band-limit.
+
+        sampling (str): Sampling scheme.
+
+        reality (bool): Whether the signal on the sphere is real.
+
+        spin (int): Harmonic spin.
+
+        nside (int): HEALPix Nside resolution parameter.
+
+    Returns:
+        np.ndarray | jnp.ndarray | torch.Tensor: Wigner-d kernel.
+
+    """
+    with ensure_compile_time_eval():
+        kernel = _kernel_functions[method](
+            L=L,
+            sampling=sampling,
+            reality=reality,
+            spin=spin,
+            nside=nside,
+            forward=forward,
+        )
+    if method == "numpy":
+        kernel.flags.writeable = False
+    if method == "torch":
+        kernel = kernel.to(device)
+    return kernel
@@ -19,6 +19,7 @@ def generate_precomputes(
     nside: int = None,
     forward: bool = False,
     L_lower: int = 0,
+    betas: np.ndarray = None,
 ) -> List[np.ndarray]:
     r"""
     Compute recursion coefficients with :math:`\mathcal{O}(L^3)` memory overhead.
@@ -44,6 +45,10 @@ def generate_precomputes(
         L_lower (int, optional): Harmonic lower-bound. Transform will only be computed
             for :math:`\texttt{L_lower} \leq \ell < \texttt{L}`. Defaults to 0.
 
+        betas (np.ndarray, optional): Array of polar angles in radians. If provided
+            these override the angles inferred from the sampling scheme. Defaults to
+            None.
+
     Returns:
         List[np.ndarray]: List of precomputed coefficient arrays.
 
@@ -54,11 +59,14 @@ def generate_precomputes(
     mm = -spin
     L0 = L_lower
     # Correct for mw to mwss conversion
-    if forward and sampling.lower() in ["mw", "mwss"]:
-        sampling = "mwss"
-        beta = samples.thetas(2 * L, "mwss")[1:-1]
+    if betas is None:
+        if forward and sampling.lower() in ["mw", "mwss"]:
+            sampling = "mwss"
+            beta = samples.thetas(2 * L, "mwss")[1:-1]
+        else:
+            beta = samples.thetas(L, sampling, nside)
     else:
-        beta = samples.thetas(L, sampling, nside)
+        beta = betas
 
     ntheta = len(beta)  # Number of theta samples
     el = np.arange(L0, L)
@@ -376,7 +384,13 @@ def generate_precomputes_wigner_jax(
 
 
 def compute_all_slices(
-    beta: np.ndarray, L: int, spin: int, precomps=None
+    beta: np.ndarray,
+    L: int,
+    spin: int,
+    sampling: str = "mw",
+    forward: bool = False,
+    nside: int = None,
+    precomps=None,
 ) -> np.ndarray:
     r"""
     Compute a particular slice :math:`m^{\prime}`, denoted `mm`,
@@ -407,6 +421,15 @@ def compute_all_slices(
 
         spin (int, optional): Harmonic spin. Defaults to 0.
 
+        sampling (str, optional): Sampling scheme.  Supported sampling schemes include
+            {"mw", "mwss", "dh", "healpix"}.  Defaults to "mw".
+
+        forward (bool, optional): Whether to provide forward or inverse shift.
+            Defaults to False.
+
+        nside (int, optional): HEALPix Nside resolution parameter.  Only required
+            if sampling="healpix".  Defaults to None.
+
         precomps (List[np.ndarray]): Precomputed recursion coefficients with memory overhead
             :math:`\mathcal{O}(L^2)`, which is minimal.
 
@@ -430,11 +453,11 @@ def compute_all_slices(
 
     dl_test = np.zeros((2 * L - 1, ntheta, L), dtype=np.float64)
     if precomps is None:
-        lrenorm, offset, vsign, cpi, cp2, cs, indices = generate_precomputes(
-            beta, L, mm
+        lrenorm, vsign, cpi, cp2, indices = generate_precomputes(
+            L, spin, sampling, nside, forward, 0, beta
         )
     else:
-        lrenorm, offset, vsign, cpi, cp2, cs, indices = precomps
+        lrenorm, vsign, cpi, cp2, indices = precomps
 
     lamb = np.zeros((ntheta, L), np.float64)
     for i in range(2):
@@ -489,8 +512,11 @@ def compute_all_slices(
                 dl_test[sind + sgn * m],
             )
 
-            bigi = 1.0 / abs(dl_entry)
-            lbig = np.log(abs(dl_entry))
+            # Entries can vanish exactly (e.g. on HEALPix rings), in which case
+            # the iterants are left unscaled rather than renormalised by zero.
+            big = np.where(dl_entry == 0, 1.0, abs(dl_entry))
+            bigi = 1.0 / big
+            lbig = np.log(big)
 
             dl_iter[0] = np.where(index, bigi * dl_iter[1], dl_iter[0])
             dl_iter[1] = np.where(index, bigi * dl_entry, dl_iter[1])
@@ -627,8 +653,11 @@ def compute_all_slices_jax(
                 )
             )
 
-            bigi = 1.0 / abs(dl_entry)
-            lbig = jnp.log(abs(dl_entry))
+            # Entries can vanish exactly (e.g. on HEALPix rings), in which case
+            # the iterants are left unscaled rather than renormalised by zero.
+            big = jnp.where(dl_entry == 0, 1.0, abs(dl_entry))
+            bigi = 1.0 / big
+            lbig = jnp.log(big)
 
             dl_iter = dl_iter.at[0].set(jnp.where(index, bigi * dl_iter[1], dl_iter[0]))
             dl_iter = dl_iter.at[1].set(jnp.where(index, bigi * dl_entry, dl_iter[1]))
@@ -53,52 +53,42 @@ def compute_full(dl: np.ndarray, beta: float, L: int, el: int) -> np.ndarray:
         coshb = -np.cos(beta / 2.0)
         sinhb = np.sin(beta / 2.0)
 
-        # Initialise the plane of the dl-matrix to 0.0 for the recursion
-        # from l - 1 to l - 1/2.
+        # Recursion from l - 1 to l - 1/2, evaluated over the whole plane at once.
+        # Entries of dd are indexed as dd[k, i] and are unnormalised; the overall
+        # factor is applied after the second half-step.
         dd = np.zeros((2 * el + 2, 2 * el + 2))
         j = 2 * el - 1
+        sqrt_jm = np.sqrt(j - np.arange(j))
+        sqrt_p1 = np.sqrt(np.arange(j) + 1)
 
-        for k in range(0, j):
-            sqrt_jmk = np.sqrt(j - k)
-            sqrt_kp1 = np.sqrt(k + 1)
+        dlj = dl[L - el : L + el - 1, L - el : L + el - 1]
 
-            for i in range(0, j):
-                sqrt_jmi = np.sqrt(j - i)
-                sqrt_ip1 = np.sqrt(i + 1)
-
-                dlj = dl[k - (el - 1) + L - 1, i - (el - 1) + L - 1] / j
-
-                dd[i, k] += sqrt_jmi * sqrt_jmk * dlj * coshb
-                dd[i + 1, k] -= sqrt_ip1 * sqrt_jmk * dlj * sinhb
-                dd[i, k + 1] += sqrt_jmi * sqrt_kp1 * dlj * sinhb
-                dd[i + 1, k + 1] += sqrt_ip1 * sqrt_kp1 * dlj * coshb
+        dd[:j, :j] += np.outer(sqrt_jm, sqrt_jm) * dlj * coshb
+        dd[:j, 1 : j + 1] -= np.outer(sqrt_jm, sqrt_p1) * dlj * sinhb
+        dd[1 : j + 1, :j] += np.outer(sqrt_p1, sqrt_jm) * dlj * sinhb
+        dd[1 : j + 1, 1 : j + 1] += np.outer(sqrt_p1, sqrt_p1) * dlj * coshb
 
         # Having constructed the d^(l+1/2) matrix in dd, do the second
         # half-step recursion from dd to dl. Start by initilalising
         # the plane of the dl-matrix to 0.0.
         dl[-el + L - 1 : el + 1 + L - 1, -el + L - 1 : el + 1 + L - 1] = 0.0
         j = 2 * el
-
-        for k in range(0, j):
-            sqrt_jmk = np.sqrt(j - k)
-            sqrt_kp1 = np.sqrt(k + 1)
-
-            for i in range(0, j):
-                sqrt_jmi = np.sqrt(j - i)
-                sqrt_ip1 = np.sqrt(i + 1)
-
-                ddj = dd[i, k] / j
-
-                dl[k - el + L - 1, i - el + L - 1] += sqrt_jmi * sqrt_jmk * ddj * coshb
-                dl[k - el + L - 1, i + 1 - el + L - 1] -= (
-                    sqrt_ip1 * sqrt_jmk * ddj * sinhb
-                )
-                dl[k + 1 - el + L - 1, i - el + L - 1] += (
-                    sqrt_jmi * sqrt_kp1 * ddj * sinhb
-                )
-                dl[k + 1 - el + L - 1, i + 1 - el + L - 1] += (
-                    sqrt_ip1 * sqrt_kp1 * ddj * coshb
-                )
+        sqrt_jm = np.sqrt(j - np.arange(j))
+        sqrt_p1 = np.sqrt(np.arange(j) + 1)
+
+        ddj = dd[:j, :j]
+
+        dl[L - el - 1 : L + el - 1, L - el - 1 : L + el - 1] += (
+            np.outer(sqrt_jm, sqrt_jm) * ddj * coshb
+        )
+        dl[L - el - 1 : L + el - 1, L - el : L + el] -= (
+            np.outer(sqrt_jm, sqrt_p1) * ddj * sinhb
+        )
+        dl[L - el : L + el, L - el - 1 : L + el - 1] += (
+            np.outer(sqrt_p1, sqrt_jm) * ddj * sinhb
+        )
+        dl[L - el : L + el, L - el : L + el] += np.outer(sqrt_p1, sqrt_p1) * ddj * coshb
+        dl[L - el - 1 : L + el, L - el - 1 : L + el] /= (2 * el) * (2 * el - 1)
 
     return dl
 
@@ -174,56 +164,46 @@ def compute_full_vectorised(
         dl[:, 1 + L - 1, 1 + L - 1] = coshb**2
 
     else:
-        coshb = -np.cos(beta / 2.0)
-        sinhb = np.sin(beta / 2.0)
+        coshb = -np.cos(beta / 2.0)[:, None, None]
+        sinhb = np.sin(beta / 2.0)[:, None, None]
 
-        # Initialise the plane of the dl-matrix to 0.0 for the recursion
-        # from l - 1 to l - 1/2.
+        # Recursion from l - 1 to l - 1/2, evaluated over the whole plane at once.
+        # Entries of dd are indexed as dd[:, k, i] and are unnormalised; the overall
+        # factor is applied after the second half-step.
         dd = np.zeros((dl.shape[0], 2 * el + 2, 2 * el + 2))
         j = 2 * el - 1
+        sqrt_jm = np.sqrt(j - np.arange(j))
+        sqrt_p1 = np.sqrt(np.arange(j) + 1)
 
-        for k in range(0, j):
-            sqrt_jmk = np.sqrt(j - k)
-            sqrt_kp1 = np.sqrt(k + 1)
-
-            for i in range(0, j):
-                sqrt_jmi = np.sqrt(j - i)
-                sqrt_ip1 = np.sqrt(i + 1)
+        dlj = dl[:, L - el : L + el - 1, L - el : L + el - 1]
 
-                dlj = dl[:, k - (el - 1) + L - 1, i - (el - 1) + L - 1] / j
-
-                dd[:, i, k] += sqrt_jmi * sqrt_jmk * dlj * coshb
-                dd[:, i + 1, k] -= sqrt_ip1 * sqrt_jmk * dlj * sinhb
-                dd[:, i, k + 1] += sqrt_jmi * sqrt_kp1 * dlj * sinhb
-                dd[:, i + 1, k + 1] += sqrt_ip1 * sqrt_kp1 * dlj * coshb
+        dd[:, :j, :j] += np.outer(sqrt_jm, sqrt_jm) * dlj * coshb
+        dd[:, :j, 1 : j + 1] -= np.outer(sqrt_jm, sqrt_p1) * dlj * sinhb
+        dd[:, 1 : j + 1, :j] += np.outer(sqrt_p1, sqrt_jm) * dlj * sinhb
+        dd[:, 1 : j + 1, 1 : j + 1] += np.outer(sqrt_p1, sqrt_p1) * dlj * coshb
 
         # Having constructed the d^(l+1/2) matrix in dd, do the second
         # half-step recursion from dd to dl. Start by initilalising
         # the plane of the dl-matrix to 0.0.
         dl[:, -el + L - 1 : el + 1 + L - 1, -el + L - 1 : el + 1 + L - 1] = 0.0
         j = 2 * el
-
-        for k in range(0, j):
-            sqrt_jmk = np.sqrt(j - k)
-            sqrt_kp1 = np.sqrt(k + 1)
-
-            for i in range(0, j):
-                sqrt_jmi = np.sqrt(j - i)
-                sqrt_ip1 = np.sqrt(i + 1)
-
-                ddj = dd[:, i, k] / j
-
-                dl[:, k - el + L - 1, i - el + L - 1] += (
-                    sqrt_jmi * sqrt_jmk * ddj * coshb
-                )
-                dl[:, k - el + L - 1, i + 1 - el + L - 1] -= (
-                    sqrt_ip1 * sqrt_jmk * ddj * sinhb
-                )
-                dl[:, k + 1 - el + L - 1, i - el + L - 1] += (
-                    sqrt_jmi * sqrt_kp1 * ddj * sinhb
-                )
-                dl[:, k + 1 - el + L - 1, i + 1 - el + L - 1] += (
-                    sqrt_ip1 * sqrt_kp1 * ddj * coshb
-                )
+        sqrt_jm = np.sqrt(j - np.arange(j))
+        sqrt_p1 = np.sqrt(np.arange(j) + 1)
+
+        ddj = dd[:, :j, :j]
+
+        dl[:, L - el - 1 : L + el - 1, L - el - 1 : L + el - 1] += (
+            np.outer(sqrt_jm, sqrt_jm) * ddj * coshb
+        )
+        dl[:, L - el - 1 : L + el - 1, L - el : L + el] -= (
+            np.outer(sqrt_jm, sqrt_p1) * ddj * sinhb
+        )
+        dl[:, L - el : L + el, L - el - 1 : L + el - 1] += (
+            np.outer(sqrt_p1, sqrt_jm) * ddj * sinhb
+        )
+        dl[:, L - el : L + el, L - el : L + el] += (
+            np.outer(sqrt_p1, sqrt_p1) * ddj * coshb
+        )
+        dl[:, L - el - 1 : L + el, L - el - 1 : L + el] /= (2 * el) * (2 * el - 1)
 
     return dl
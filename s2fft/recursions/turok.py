@@ -1,3 +1,5 @@
+import math
+from functools import lru_cache
 from warnings import warn
 
 import numpy as np
@@ -154,14 +156,14 @@ def compute_quarter_slice(
     # These constants handle overflow by retrospectively renormalising
     big_const = 1e10
     bigi = 1.0 / big_const
-    lbig = np.log(big_const)
+    lbig = math.log(big_const)
 
     # Trigonometric constant adopted throughout
-    c = np.cos(beta)
-    s = np.sin(beta)
-    t = np.tan(-beta / 2.0)
-    lt = np.log(np.abs(t))
-    c2 = np.cos(beta / 2.0)
+    c = math.cos(beta)
+    s = math.sin(beta)
+    t = math.tan(-beta / 2.0)
+    lt = math.log(abs(t))
+    c2 = math.cos(beta / 2.0)
     omc = 1.0 - c
 
     # Indexing boundaries
@@ -173,22 +175,21 @@ def compute_quarter_slice(
     sign = np.zeros(2, dtype=np.float64)
     cpi = np.zeros(el + 1, dtype=np.float64)
     cp2 = np.zeros(el + 1, dtype=np.float64)
-    log_first_row = np.zeros(2 * el + 1, dtype=np.float64)
 
     # Populate vectors for first row
-    log_first_row[0] = 2.0 * el * np.log(np.abs(c2))
-
-    for i in range(2, np.max(half_slices) + 1):
-        ratio = (2 * el + 2 - i) / (i - 1)
-        log_first_row[i - 1] = log_first_row[i - 2] + np.log(ratio) / 2 + lt
+    log_first_row = (
+        2.0 * el * math.log(abs(c2))
+        + _log_first_row_ratios(el)
+        + lt * np.arange(2 * el + 1)
+    )
 
     for i, slice in enumerate(half_slices):
-        sign[i] = (t / np.abs(t)) ** ((slice - 1) % 2)
+        sign[i] = (t / abs(t)) ** ((slice - 1) % 2)
 
     # Initialising coefficients cp(m)= cplus(l-m).
-    cpi[0] = 2.0 / np.sqrt(2 * el)
+    cpi[0] = 2.0 / math.sqrt(2 * el)
     for m in range(2, el + 1):
-        cpi[m - 1] = 2.0 / np.sqrt(m * (2 * el + 1 - m))
+        cpi[m - 1] = 2.0 / math.sqrt(m * (2 * el + 1 - m))
         cp2[m - 1] = cpi[m - 1] / cpi[m - 2]
 
     # Use Turok & Bucher recursion to evaluate a single half row
@@ -212,11 +213,11 @@ def compute_quarter_slice(
                 )
                 if dl[lims[i] + sgn * m] > big_const:
                     lrenorm[i] = lrenorm[i] - lbig
-                    for im in range(m + 1):
-                        dl[lims[i] + sgn * im] = dl[lims[i] + sgn * im] * bigi
+                    lo, hi = sorted((lims[i], lims[i] + sgn * m))
+                    dl[lo : hi + 1] *= bigi
 
             # Apply renormalisation
-            renorm = sign[i] * np.exp(log_first_row[slice - 1] - lrenorm[i])
+            renorm = sign[i] * math.exp(log_first_row[slice - 1] - lrenorm[i])
 
             if i == 0:
                 for m in range(el):
@@ -277,13 +278,13 @@ def compute_quarter(dl: np.ndarray, beta: float, ell: int, L: int) -> np.ndarray
     big_const = 1e10
     big = big_const
     bigi = 1.0 / big_const
-    lbig = np.log(big)
+    lbig = math.log(big)
 
     # Trigonometric constant adopted throughout
-    c = np.cos(beta)
-    s = np.sin(beta)
-    t = np.tan(-beta / 2.0)
-    c2 = np.cos(beta / 2.0)
+    c = math.cos(beta)
+    s = math.sin(beta)
+    t = math.tan(-beta / 2.0)
+    c2 = math.cos(beta / 2.0)
     omc = 1.0 - c
 
     # Vectors with indexing -L < m < L adopted throughout
@@ -291,23 +292,19 @@ def compute_quarter(dl: np.ndarray, beta: float, ell: int, L: int) -> np.ndarray
     cp = np.zeros(2 * ell + 1, dtype=np.float64)
     cpi = np.zeros(2 * ell + 1, dtype=np.float64)
     cp2 = np.zeros(2 * ell + 1, dtype=np.float64)
-    log_first_row = np.zeros(2 * ell + 1, dtype=np.float64)
-    sign = np.zeros(2 * ell + 1, dtype=np.float64)
 
     # Populate vectors for first row
-    log_first_row[0] = 2.0 * ell * np.log(np.abs(c2))
-    sign[0] = 1.0
-
-    for i in range(2, 2 * ell + 2):
-        m = ell + 1 - i
-        ratio = np.sqrt((m + ell + 1) / (ell - m))
-        log_first_row[i - 1] = log_first_row[i - 2] + np.log(ratio) + np.log(np.abs(t))
-        sign[i - 1] = sign[i - 2] * t / np.abs(t)
+    log_first_row = (
+        2.0 * ell * math.log(abs(c2))
+        + _log_first_row_ratios(ell)
+        + math.log(abs(t)) * np.arange(2 * ell + 1)
+    )
+    sign = (t / abs(t)) ** np.arange(2 * ell + 1)
 
     # Initialising coefficients cp(m)= cplus(l-m).
     for m in range(1, ell + 2):
         xm = ell - m
-        cpi[m - 1] = 2.0 / np.sqrt(ell * (ell + 1) - xm * (xm + 1))
+        cpi[m - 1] = 2.0 / math.sqrt(ell * (ell + 1) - xm * (xm + 1))
         cp[m - 1] = 1.0 / cpi[m - 1]
 
     for m in range(2, ell + 2):
@@ -331,8 +328,7 @@ def compute_quarter(dl: np.ndarray, beta: float, ell: int, L: int) -> np.ndarray
 
                 if dl[index - lp1, m + 1 - lp1] > big:
                     lrenorm[index - 1] = lrenorm[index - 1] - lbig
-                    for im in range(1, m + 2):
-                        dl[index - lp1, im - lp1] = dl[index - lp1, im - lp1] * bigi
+                    dl[index - lp1, 1 - lp1 : m + 2 - lp1] *= bigi
 
     # Use Turok & Bucher recursion to fill horizontal to anti-diagonal (upper left eight)
     for index in range(ell + 2, 2 * ell + 1):
@@ -348,19 +344,15 @@ def compute_quarter(dl: np.ndarray, beta: float, ell: int, L: int) -> np.ndarray
                 )
                 if dl[index - lp1, m + 1 - lp1] > big:
                     lrenorm[index - 1] = lrenorm[index - 1] - lbig
-                    for im in range(1, m + 2):
-                        dl[index - lp1, im - lp1] = dl[index - lp1, im - lp1] * bigi
+                    dl[index - lp1, 1 - lp1 : m + 2 - lp1] *= bigi
 
     # Apply renormalisation
+    renorm = sign * np.exp(log_first_row - lrenorm)
     for i in range(1, ell + 2):
-        renorm = sign[i - 1] * np.exp(log_first_row[i - 1] - lrenorm[i - 1])
-        for j in range(1, i + 1):
-            dl[i - lp1, j - lp1] = dl[i - lp1, j - lp1] * renorm
+        dl[i - lp1, 1 - lp1 : i + 1 - lp1] *= renorm[i - 1]
 
     for i in range(ell + 2, 2 * ell + 2):
-        renorm = sign[i - 1] * np.exp(log_first_row[i - 1] - lrenorm[i - 1])
-        for j in range(1, 2 * ell + 2 - i + 1):
-            dl[i - lp1, j - lp1] = dl[i - lp1, j - lp1] * renorm
+        dl[i - lp1, 1 - lp1 : 2 * ell + 3 - i - lp1] *= renorm[i - 1]
 
     return dl
 
@@ -381,33 +373,37 @@ def fill(dl: np.ndarray, ell: int, L: int) -> np.ndarray:
         np.ndarray: A complete Wigner-d matrix of dimension [2L-1, 2L-1].
 
     """
-    lp1 = 1 - (L - 1 - ell)  # Offset for indexing (currently -L < m < L in 2D)
+    n = 2 * ell + 1
+    rows, cols = np.indices((n, n))
+    dl_ell = dl[L - 1 - ell : L + ell, L - 1 - ell : L + ell]
+
+    # Reflect across diagonal
+    upper = (rows < cols) & (rows + cols < n)
+    dl_ell[upper] = ((-1.0) ** (rows + cols) * dl_ell.T)[upper]
 
     # Reflect across anti-diagonal
-    for i in range(1, ell + 1):
-        for j in range(ell + 1, 2 * ell + 1 - i + 1):
-            dl[2 * ell + 2 - i - lp1, 2 * ell + 2 - j - lp1] = dl[j - lp1, i - lp1]
+    lower = rows + cols >= n
+    dl_ell[lower] = dl_ell[::-1, ::-1].T[lower]
 
-    # Reflect across diagonal
-    for i in range(1, ell + 2):
-        sgn = -1
-        for j in range(i + 1, ell + 2):
-            dl[i - lp1, j - lp1] = dl[j - lp1, i - lp1] * sgn
-            sgn = sgn * (-1)
+    return dl
 
-    # Fill right matrix
-    for i in range(ell + 2, 2 * ell + 2):
-        sgn = (-1) ** (i + 1)
 
-        for j in range(1, 2 * ell + 2 - i + 1):
-            dl[j - lp1, i - lp1] = dl[i - lp1, j - lp1] * sgn
-            sgn = sgn * (-1)
+@lru_cache(maxsize=None)
+def _log_first_row_ratios(el: int) -> np.ndarray:
+    r"""
+    Cumulative log-ratios of the :math:`\beta`-independent factors of the first row
+    of the Wigner-d matrix, i.e. :math:`\frac{1}{2}\log\binom{2\ell}{i}` for
+    :math:`0 \leq i \leq 2\ell`.
 
-        for j in range(i, 2 * ell + 2):
-            dl[j - lp1, i - lp1] = dl[2 * ell + 2 - i - lp1, 2 * ell + 2 - j - lp1]
+    Args:
+        el (int): Harmonic degree of Wigner-d matrix.
 
-    for i in range(ell + 2, 2 * ell + 2):
-        for j in range(2 * ell + 3 - i, i - 1 + 1):
-            dl[j - lp1, i - lp1] = dl[2 * ell + 2 - i - lp1, 2 * ell + 2 - j - lp1]
+    Returns:
+        np.ndarray: Read-only vector of length :math:`2\ell+1`.
 
-    return dl
+    """
+    i = np.arange(2, 2 * el + 2)
+    log_ratios = np.zeros(2 * el + 1, dtype=np.float64)
+    log_ratios[1:] = np.cumsum(np.log((2 * el + 2 - i) / (i - 1)) / 2)
+    log_ratios.flags.writeable = False
+    return log_ratios
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
@@ -646,6 +647,47 @@ def hp_getidx(L: int, el: int, m: int) -> int:
     return m * (2 * L - 1 - m) // 2 + el
 
 
+@lru_cache(maxsize=None)
+def _elm_index_map(L: int) -> Tuple[np.ndarray, np.ndarray]:
+    r"""
+    Harmonic degrees and orders of every 1D indexed coefficient, in 1D index order.
+
+    Args:
+        L (int): Harmonic band-limit.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Read-only arrays of :math:`\ell` and :math:`m`
+        such that entry `i` corresponds to 1D index `i`.
+
+    """
+    els = np.repeat(np.arange(L), 2 * np.arange(L) + 1)
+    ms = np.arange(L**2) - els**2 - els
+    els.flags.writeable = False
+    ms.flags.writeable = False
+    return els, ms
+
+
+@lru_cache(maxsize=None)
+def _hp_index_map(L: int) -> Tuple[np.ndarray, np.ndarray]:
+    r"""
+    Harmonic degrees and orders of every HEALPix indexed coefficient, in HEALPix
+    index order.
+
+    Args:
+        L (int): Harmonic band-limit.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Read-only arrays of :math:`\ell` and
+        :math:`m \geq 0` such that entry `i` corresponds to HEALPix index `i`.
+
+    """
+    ms = np.repeat(np.arange(L), L - np.arange(L))
+    els = np.arange(L * (L + 1) // 2) - hp_getidx(L, 0, ms)
+    els.flags.writeable = False
+    ms.flags.writeable = False
+    return els, ms
+
+
 def flm_2d_to_1d(flm_2d: np.ndarray, L: int) -> np.ndarray:
     r"""
     Convert from 2D indexed harmonic coefficients to 1D indexed coefficients.
@@ -686,9 +728,8 @@ def flm_2d_to_1d(flm_2d: np.ndarray, L: int) -> np.ndarray:
                 f"Cannot convert flm of dimension {flm_2d.shape} to 1D indexing"
             )
 
-    for el in range(L):
-        for m in range(-el, el + 1):
-            flm_1d[elm2ind(el, m)] = flm_2d[el, L - 1 + m]
+    els, ms = _elm_index_map(L)
+    flm_1d[:] = flm_2d[els, L - 1 + ms]
 
     return flm_1d
 
@@ -733,9 +774,8 @@ def flm_1d_to_2d(flm_1d: np.ndarray, L: int) -> np.ndarray:
                 f"Cannot convert flm of dimension {flm_2d.shape} to 2D indexing"
             )
 
-    for el in range(L):
-        for m in range(-el, el + 1):
-            flm_2d[el, L - 1 + m] = flm_1d[elm2ind(el, m)]
+    els, ms = _elm_index_map(L)
+    flm_2d[els, L - 1 + ms] = flm_1d[: L**2]
 
     return flm_2d
 
@@ -787,11 +827,12 @@ def flm_hp_to_2d(flm_hp: np.ndarray, L: int) -> np.ndarray:
     if len(flm_hp.shape) != 1:
         raise ValueError("Healpix indexed flms are not flat")
 
-    for el in range(L):
-        flm_2d[el, L - 1 + 0] = flm_hp[hp_getidx(L, el, 0)]
-        for m in range(1, el + 1):
-            flm_2d[el, L - 1 + m] = flm_hp[hp_getidx(L, el, m)]
-            flm_2d[el, L - 1 - m] = (-1) ** m * np.conj(flm_2d[el, L - 1 + m])
+    els, ms = _hp_index_map(L)
+    flm_2d[els, L - 1 + ms] = flm_hp[: L * (L + 1) // 2]
+    pos = ms > 0
+    flm_2d[els[pos], L - 1 - ms[pos]] = (-1) ** ms[pos] * np.conj(
+        flm_2d[els[pos], L - 1 + ms[pos]]
+    )
 
     return flm_2d
 
@@ -844,9 +885,8 @@ def flm_2d_to_hp(flm_2d: np.ndarray, L: int) -> np.ndarray:
     if len(flm_hp.shape) != 1:
         raise ValueError("HEALPix indexed flms are not flat")
 
-    for el in range(L):
-        for m in range(0, el + 1):
-            flm_hp[hp_getidx(L, el, m)] = flm_2d[el, L - 1 + m]
+    els, ms = _hp_index_map(L)
+    flm_hp[:] = flm_2d[els, L - 1 + ms]
 
     return flm_hp
 
@@ -892,8 +932,7 @@ def lm2lm_hp(flm: np.ndarray, L: int) -> np.ndarray:
     """
     flm_hp = np.zeros(int(L * (L + 1) / 2), dtype=np.complex128)
 
-    for el in range(0, L):
-        for m in range(0, el + 1):
-            flm_hp[hp_getidx(L, el, m)] = flm[elm2ind(el, m)]
+    els, ms = _hp_index_map(L)
+    flm_hp[:] = flm[elm2ind(els, ms)]
 
     return flm_hp
@@ -22,7 +22,8 @@ def spectral_folding(fm: np.ndarray, nphi: int, L: int) -> np.ndarray:
     coefficients, i.e. aliasing high frequencies.
 
     Args:
-        fm (np.ndarray): Slice of Fourier coefficients corresponding to ring at latitute t.
+        fm (np.ndarray): Slice of Fourier coefficients corresponding to ring at latitute t,
+            or a stack of such slices along leading axes.
 
         nphi (int): Total number of pixel space phi samples for latitude t.
 
@@ -36,15 +37,15 @@ def spectral_folding(fm: np.ndarray, nphi: int, L: int) -> np.ndarray:
 
     slice_start = L - nphi // 2
     slice_stop = slice_start + nphi
-    ftm_slice = fm[slice_start:slice_stop]
+    ftm_slice = fm[..., slice_start:slice_stop]
 
     idx = 1
     while slice_start - idx >= 0:
-        ftm_slice[-idx % nphi] += fm[slice_start - idx]
+        ftm_slice[..., -idx % nphi] += fm[..., slice_start - idx]
         idx += 1
     idx = 0
-    while slice_stop + idx < len(fm):
-        ftm_slice[idx % nphi] += fm[slice_stop + idx]
+    while slice_stop + idx < fm.shape[-1]:
+        ftm_slice[..., idx % nphi] += fm[..., slice_stop + idx]
         idx += 1
 
     return ftm_slice
@@ -99,15 +100,17 @@ def spectral_folding_torch(fm: torch.tensor, nphi: int, L: int) -> torch.tensor:
     slice_start = L - nphi // 2
     slice_stop = slice_start + nphi
     ftm_slice = fm[slice_start:slice_stop]
+    indices_lower = torch.arange(1, L - nphi // 2 + 1, device=fm.device)
+    indices_upper = torch.arange(L - nphi // 2, device=fm.device)
 
     ftm_slice = ftm_slice.put_(
-        -torch.arange(1, L - nphi // 2 + 1) % nphi,
-        fm[slice_start - torch.arange(1, L - nphi // 2 + 1)],
+        -indices_lower % nphi,
+        fm[slice_start - indices_lower],
         accumulate=True,
     )
     ftm_slice = ftm_slice.put_(
-        torch.arange(L - nphi // 2) % nphi,
-        fm[slice_stop + torch.arange(L - nphi // 2)],
+        indices_upper % nphi,
+        fm[slice_stop + indices_upper],
         accumulate=True,
     )
 
@@ -120,7 +123,8 @@ def spectral_periodic_extension(fm: np.ndarray, nphi: int, L: int) -> np.ndarray
     coefficients, i.e. imposed periodicity in Fourier space.
 
     Args:
-        fm (np.ndarray): Slice of Fourier coefficients corresponding to ring at latitute t.
+        fm (np.ndarray): Slice of Fourier coefficients corresponding to ring at latitute t,
+            or a stack of such slices along leading axes.
 
         nphi (int): Total number of pixel space phi samples for latitude t.
 
@@ -134,16 +138,16 @@ def spectral_periodic_extension(fm: np.ndarray, nphi: int, L: int) -> np.ndarray
 
     slice_start = L - nphi // 2
     slice_stop = slice_start + nphi
-    fm_full = np.zeros(2 * L, dtype=np.complex128)
-    fm_full[slice_start:slice_stop] = fm
+    fm_full = np.zeros(fm.shape[:-1] + (2 * L,), dtype=fm.dtype)
+    fm_full[..., slice_start:slice_stop] = fm
 
     idx = 1
     while slice_start - idx >= 0:
-        fm_full[slice_start - idx] = fm[-idx % nphi]
+        fm_full[..., slice_start - idx] = fm[..., -idx % nphi]
         idx += 1
     idx = 0
-    while slice_stop + idx < len(fm_full):
-        fm_full[slice_stop + idx] = fm[idx % nphi]
+    while slice_stop + idx < fm_full.shape[-1]:
+        fm_full[..., slice_stop + idx] = fm[..., idx % nphi]
         idx += 1
 
     return fm_full
@@ -192,9 +196,9 @@ def spectral_periodic_extension_torch(fm: torch.tensor, L: int) -> torch.tensor:
     nphi = fm.shape[0]
     return torch.concatenate(
         (
-            fm[-torch.arange(L - nphi // 2, 0, -1) % nphi],
+            fm[-torch.arange(L - nphi // 2, 0, -1, device=fm.device) % nphi],
             fm,
-            fm[torch.arange(L - (nphi + 1) // 2) % nphi],
+            fm[torch.arange(L - (nphi + 1) // 2, device=fm.device) % nphi],
         )
     )
 
@@ -262,26 +266,38 @@ def healpix_fft_numpy(f: np.ndarray, L: int, nside: int, reality: bool) -> np.nd
         np.ndarray: Array of Fourier coefficients for all latitudes.
 
     """
-    index = 0
-    ftm = np.zeros(samples.ftm_shape(L, "healpix", nside), dtype=np.complex128)
-    ntheta = ftm.shape[0]
-    for t in range(ntheta):
-        nphi = samples.nphi_ring(t, nside)
+
+    def f_chunks_to_ftm_rows(f_chunks, nphi):
         if reality and nphi == 2 * L:
-            fm_chunk = np.zeros(nphi, dtype=np.complex128)
-            fm_chunk[nphi // 2 :] = np.fft.rfft(
-                np.real(f[index : index + nphi]), norm="backward"
-            )[:-1]
-        else:
-            fm_chunk = np.fft.fftshift(
-                np.fft.fft(f[index : index + nphi], norm="backward")
+            fm_chunks = np.zeros(
+                f_chunks.shape, dtype=np.result_type(f_chunks, np.complex64)
             )
-        ftm[t] = (
-            fm_chunk
+            fm_chunks[..., nphi // 2 :] = np.fft.rfft(
+                np.real(f_chunks), norm="backward"
+            )[..., :-1]
+        else:
+            fm_chunks = np.fft.fftshift(np.fft.fft(f_chunks, norm="backward"), axes=-1)
+        return (
+            fm_chunks
             if nphi == 2 * L
-            else spectral_periodic_extension(fm_chunk, nphi, L)
+            else spectral_periodic_extension(fm_chunks, nphi, L)
         )
-        index += nphi
+
+    ftm = np.zeros(
+        samples.ftm_shape(L, "healpix", nside), dtype=np.result_type(f, np.complex64)
+    )
+    # Polar theta rings each have a distinct number of phi samples
+    start_index, end_index = 0, 12 * nside**2
+    for t in range(nside - 1):
+        nphi = 4 * (t + 1)
+        ftm[t] = f_chunks_to_ftm_rows(f[start_index : start_index + nphi], nphi)
+        ftm[-(t + 1)] = f_chunks_to_ftm_rows(f[end_index - nphi : end_index], nphi)
+        start_index, end_index = start_index + nphi, end_index - nphi
+    # Process all f chunks for the equal sized equatorial theta rings together
+    nphi = 4 * nside
+    ftm[nside - 1 : 3 * nside] = f_chunks_to_ftm_rows(
+        f[start_index:end_index].reshape((-1, nphi)), nphi
+    )
     return ftm
 
 
@@ -373,12 +389,16 @@ def healpix_fft_torch(
 
     """
     index = 0
-    ftm = torch.zeros(samples.ftm_shape(L, "healpix", nside), dtype=torch.complex128)
+    ftm = torch.zeros(
+        samples.ftm_shape(L, "healpix", nside),
+        dtype=torch.complex128,
+        device=f.device,
+    )
     ntheta = ftm.shape[0]
     for t in range(ntheta):
         nphi = samples.nphi_ring(t, nside)
         if reality and nphi == 2 * L:
-            fm_chunk = torch.zeros(nphi, dtype=torch.complex128)
+            fm_chunk = torch.zeros(nphi, dtype=torch.complex128, device=f.device)
             fm_chunk[nphi // 2 :] = torch.fft.rfft(
                 torch.real(f[index : index + nphi]), norm="backward"
             )[:-1]
@@ -461,21 +481,26 @@ def healpix_ifft_numpy(
         np.ndarray: HEALPix pixel-space array.
 
     """
-    f = np.zeros(samples.f_shape(sampling="healpix", nside=nside), dtype=np.complex128)
-    ntheta = ftm.shape[0]
-    index = 0
-    for t in range(ntheta):
-        nphi = samples.nphi_ring(t, nside)
-        fm_chunk = ftm[t] if nphi == 2 * L else spectral_folding(ftm[t], nphi, L)
+
+    def ftm_rows_to_f_chunks(ftm_rows, nphi):
+        fm_chunks = ftm_rows if nphi == 2 * L else spectral_folding(ftm_rows, nphi, L)
         if reality and nphi == 2 * L:
-            f[index : index + nphi] = np.fft.irfft(
-                fm_chunk[nphi // 2 :], nphi, norm="forward"
-            )
+            return np.fft.irfft(fm_chunks[..., nphi // 2 :], nphi, norm="forward")
         else:
-            f[index : index + nphi] = np.fft.ifft(
-                np.fft.ifftshift(fm_chunk), norm="forward"
-            )
-        index += nphi
+            return np.fft.ifft(np.fft.ifftshift(fm_chunks, axes=-1), norm="forward")
+
+    f = np.zeros(samples.f_shape(sampling="healpix", nside=nside), dtype=ftm.dtype)
+    # Polar theta rings each have a distinct number of phi samples
+    start_index, end_index = 0, 12 * nside**2
+    for t in range(nside - 1):
+        nphi = 4 * (t + 1)
+        f[start_index : start_index + nphi] = ftm_rows_to_f_chunks(ftm[t], nphi)
+        f[end_index - nphi : end_index] = ftm_rows_to_f_chunks(ftm[-(t + 1)], nphi)
+        start_index, end_index = start_index + nphi, end_index - nphi
+    # Process all ftm rows for the equal sized equatorial theta rings together
+    f[start_index:end_index] = ftm_rows_to_f_chunks(
+        ftm[nside - 1 : 3 * nside], 4 * nside
+    ).flatten()
     return f
 
 
@@ -554,7 +579,9 @@ def healpix_ifft_torch(
 
     """
     f = torch.zeros(
-        samples.f_shape(sampling="healpix", nside=nside), dtype=torch.complex128
+        samples.f_shape(sampling="healpix", nside=nside),
+        dtype=torch.complex128,
+        device=ftm.device,
     )
     ntheta = ftm.shape[0]
     index = 0
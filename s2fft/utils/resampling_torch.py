@@ -64,7 +64,9 @@ def mw_to_mwss_theta(f_mw: torch.tensor, L: int, spin: int = 0) -> torch.tensor:
     """
     f_mw_ext = periodic_extension(f_mw, L, spin=spin, sampling="mw")
     fmp_mwss_ext = torch.zeros(
-        (f_mw_ext.shape[0], 2 * L, 2 * L - 1), dtype=torch.complex128
+        (f_mw_ext.shape[0], 2 * L, 2 * L - 1),
+        dtype=torch.complex128,
+        device=f_mw.device,
     )
 
     fmp_mwss_ext[:, 1:, :] = torch.fft.fftshift(
@@ -76,7 +78,7 @@ def mw_to_mwss_theta(f_mw: torch.tensor, L: int, spin: int = 0) -> torch.tensor:
         fmp_mwss_ext[:, 1:, :],
         torch.exp(
             -1j
-            * torch.arange(-(L - 1), L, dtype=torch.float64)
+            * torch.arange(-(L - 1), L, dtype=torch.float64, device=f_mw.device)
             * torch.pi
             / (2 * L - 1)
         ),
@@ -124,7 +126,9 @@ def mw_to_mwss_phi(f_mw: torch.tensor, L: int) -> torch.tensor:
         sampling in :math:`\theta` of the input signal.
 
     """
-    f_mwss = torch.zeros((f_mw.shape[0], L + 1, 2 * L), dtype=torch.complex128)
+    f_mwss = torch.zeros(
+        (f_mw.shape[0], L + 1, 2 * L), dtype=torch.complex128, device=f_mw.device
+    )
     f_mwss[:, :, 1:] = torch.fft.fftshift(
         torch.fft.fft(f_mw, axis=-1, norm="forward"), dim=[-1]
     )
@@ -169,7 +173,9 @@ def periodic_extension(
     ntheta_ext = samples.ntheta_extension(L, sampling)
     m_offset = 1 if sampling == "mwss" else 0
 
-    f_ext = torch.zeros((f.shape[0], ntheta_ext, nphi), dtype=torch.complex128)
+    f_ext = torch.zeros(
+        (f.shape[0], ntheta_ext, nphi), dtype=torch.complex128, device=f.device
+    )
     f_ext[:, 0:ntheta, 0:nphi] = f[:, 0:ntheta, 0:nphi]
     f_ext = torch.fft.fftshift(torch.fft.fft(f_ext, dim=-1, norm="backward"), dim=[-1])
 
@@ -189,7 +195,7 @@ def periodic_extension(
         :,
         L + m_offset : 2 * L - 1 + m_offset,
         m_offset : 2 * L - 1 + m_offset,
-    ] *= (-1) ** (torch.arange(-(L - 1), L))
+    ] *= (-1) ** (torch.arange(-(L - 1), L, device=f.device))
     if hasattr(spin, "size"):
         f_ext[
             :,
@@ -318,7 +324,9 @@ def upsample_by_two_mwss_ext(f_ext: torch.tensor, L: int) -> torch.tensor:
 
     ntheta_ext_up = 2 * ntheta_ext
     f_ext_up = torch.zeros(
-        (f_ext.shape[0], ntheta_ext_up, nphi), dtype=torch.complex128
+        (f_ext.shape[0], ntheta_ext_up, nphi),
+        dtype=torch.complex128,
+        device=f_ext.device,
     )
     f_ext_up[:, L : ntheta_ext + L, :nphi] = f_ext[:, 0:ntheta_ext, :nphi]
     return torch.conj(
@@ -359,7 +367,9 @@ def periodic_extension_spatial_mwss(
     nphi = 2 * L
     ntheta_ext = 2 * L
 
-    f_ext = torch.zeros((f.shape[0], ntheta_ext, nphi), dtype=torch.complex128)
+    f_ext = torch.zeros(
+        (f.shape[0], ntheta_ext, nphi), dtype=torch.complex128, device=f.device
+    )
     f_ext[:, 0:ntheta, 0:nphi] = f[:, 0:ntheta, 0:nphi]
     if hasattr(spin, "size"):
         f_ext[:, ntheta:, 0 : 2 * L] = torch.einsum(
@@ -153,6 +153,9 @@ def generate_flmn(
 
     """
     flmn = np.zeros(wigner_samples.flmn_shape(L, N), dtype=np.complex128)
+    # Indices of complex-valued coefficients (m > 0) for the smallest lower bound on
+    # el, restricted per n below rather than regenerated
+    all_el_indices, all_m_indices = complex_el_and_m_indices(L, L_lower)
     for n in range(-N + 1, N):
         min_el = max(L_lower, abs(n))
         # Separately deal with m = 0 case
@@ -174,9 +177,11 @@ def generate_flmn(
                 )
         else:
             flmn[N - 1 + n, min_el:L, L - 1] = complex_normal(rng, L - min_el, var=2)
-        # Construct arrays of m and el indices for entries in flmn slices for n
+        # Select m and el indices for entries in flmn slices for n
         # corresponding to complex-valued coefficients (m > 0)
-        el_indices, m_indices = complex_el_and_m_indices(L, min_el)
+        in_range_el = all_el_indices >= min_el
+        el_indices = all_el_indices[in_range_el]
+        m_indices = all_m_indices[in_range_el]
         len_indices = len(m_indices)
         # Generate independent complex coefficients for positive m
         flmn[N - 1 + n, el_indices, L - 1 + m_indices] = complex_normal(
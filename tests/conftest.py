@@ -1,6 +1,6 @@
 """Collection of shared fixtures"""
 
-from functools import partial
+from functools import lru_cache
 
 import pytest
 
@@ -26,6 +26,20 @@ def pytest_generate_tests(metafunc):
         metafunc.parametrize("seed", metafunc.config.getoption("seed"))
 
 
+def pytest_collection_modifyitems(items):
+    # Cases differing only in method share their cached kernel and reference
+    # transforms, so keep them on the same worker under `--dist loadgroup`.
+    for item in items:
+        if "kernel_cache" in item.fixturenames and hasattr(item, "callspec"):
+            params = (
+                str(value)
+                for name, value in item.callspec.params.items()
+                if name != "method"
+            )
+            group = "-".join((item.originalname, *params))
+            item.add_marker(pytest.mark.xdist_group(name=group))
+
+
 @pytest.fixture
 def rng(seed):
     # Import numpy locally to avoid `RuntimeWarning: numpy.ndarray size changed`
@@ -35,25 +49,123 @@ def rng(seed):
     return np.random.default_rng(seed)
 
 
+@pytest.fixture(scope="session")
+def _signal_cache():
+    return {}
+
+
+def _memoized_generator(generate, rng, cache):
+    """
+    Wrap a signal generator so that signals are generated once per session for
+    each distinct generator state and set of arguments.
+
+    Keying on the generator state means a test receives exactly the signals it
+    would have without caching, including distinct signals from repeated calls.
+    On a cache hit the generator is advanced to the state it would have reached,
+    so later draws from `rng` in the same test are unaffected.
+    """
+
+    def generator(*args, **kwargs):
+        key = (
+            generate,
+            repr(rng.bit_generator.state),
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        if key not in cache:
+            signal = generate(rng, *args, **kwargs)
+            signal.setflags(write=False)
+            cache[key] = (signal, rng.bit_generator.state)
+        signal, cache_state = cache[key]
+        rng.bit_generator.state = cache_state
+        return signal
+
+    return generator
+
+
 @pytest.fixture
-def flm_generator(rng):
+def flm_generator(rng, _signal_cache):
     # Import s2fft (and indirectly numpy) locally to avoid
     # `RuntimeWarning: numpy.ndarray size changed` when importing at module level
     from s2fft.utils import signal_generator
 
-    return partial(signal_generator.generate_flm, rng)
+    return _memoized_generator(signal_generator.generate_flm, rng, _signal_cache)
 
 
 @pytest.fixture
-def flmn_generator(rng):
+def flmn_generator(rng, _signal_cache):
     # Import s2fft (and indirectly numpy) locally to avoid
     # `RuntimeWarning: numpy.ndarray size changed` when importing at module level
     from s2fft.utils import signal_generator
 
-    return partial(signal_generator.generate_flmn, rng)
+    return _memoized_generator(signal_generator.generate_flmn, rng, _signal_cache)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def kernel_cache():
+    # Import numpy locally to avoid `RuntimeWarning: numpy.ndarray size changed`
+    # when importing at module level
+    import numpy as np
+
+    @lru_cache(maxsize=None)
+    def cached_kernel(kernel_function, *args, **kwargs):
+        """
+        Build a precompute kernel once per session for each distinct set of
+        arguments, sharing it between all tests (and methods) that request it.
+        """
+        kernel = kernel_function(*args, **kwargs)
+        if isinstance(kernel, np.ndarray):
+            kernel.setflags(write=False)
+        return kernel
+
+    return cached_kernel
+
+
+@pytest.fixture(scope="session")
+def torch_kernel_cache(kernel_cache):
+    # Import torch locally to avoid `RuntimeWarning: numpy.ndarray size changed`
+    # when importing at module level
+    import torch
+
+    @lru_cache(maxsize=None)
+    def cached_torch_kernel(kernel_function, *args, **kwargs):
+        """
+        Copy a session cached kernel into a torch tensor once per session for each
+        distinct set of arguments. The copy is writable, unlike the cached array, so
+        it is shared between torch tests rather than wrapped with `torch.from_numpy`.
+        """
+        return torch.tensor(kernel_cache(kernel_function, *args, **kwargs))
+
+    return cached_torch_kernel
+
+
+@pytest.fixture(scope="session")
+def transform_cache():
+    cache = {}
+
+    def cached_transform(transform, x, *args, **kwargs):
+        """
+        Evaluate a (reference) transform once per session for each distinct input
+        array and set of arguments, sharing the read-only result between tests.
+        """
+        key = (
+            transform,
+            x.shape,
+            x.dtype.str,
+            x.tobytes(),
+            args,
+            tuple(kwargs.items()),
+        )
+        if key not in cache:
+            result = transform(x, *args, **kwargs)
+            result.setflags(write=False)
+            cache[key] = result
+        return cache[key]
+
+    return cached_transform
+
+
+@pytest.fixture(scope="session")
 def s2fft_to_so3_sampling():
     def so3_sampling(s2fft_sampling):
         if s2fft_sampling.lower() == "mw":
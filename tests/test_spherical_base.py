@@ -190,3 +190,32 @@ def test_L_lower_exception(flm_generator, L: int):
 
     with pytest.raises(AssertionError):
         spherical.inverse(flm, L, spin, sampling, L_lower=L)
+
+
+@pytest.mark.parametrize("sampling", sampling_to_test + ["healpix"])
+@pytest.mark.parametrize("method", method_to_test)
+@pytest.mark.parametrize("reality", reality_to_test)
+def test_transform_single_precision(
+    flm_generator, sampling: str, method: str, reality: bool
+):
+    L = 6
+    nside = L // 2 if sampling == "healpix" else None
+    flm = flm_generator(L=L, reality=reality)
+    f_check = spherical._inverse(
+        flm, L, 0, sampling, method, nside=nside, reality=reality
+    )
+    flm_check = spherical._forward(
+        f_check, L, 0, sampling, method, nside=nside, reality=reality
+    )
+
+    f = spherical._inverse(
+        flm, L, 0, sampling, method, nside=nside, reality=reality, dtype=np.complex64
+    )
+    assert f.dtype in (np.complex64, np.float32)
+    np.testing.assert_allclose(f, f_check, atol=1e-5)
+
+    flm_single = spherical._forward(
+        f, L, 0, sampling, method, nside=nside, reality=reality, dtype=np.complex64
+    )
+    assert flm_single.dtype == np.complex64
+    np.testing.assert_allclose(flm_single, flm_check, atol=1e-5)
@@ -3,10 +3,17 @@ import numpy as np
 import pyssht as ssht
 import pytest
 import torch
+from allpairspy import AllPairs
 
+from s2fft import recursions
 from s2fft.base_transforms import spherical as base
 from s2fft.precompute_transforms import construct as c
-from s2fft.precompute_transforms.spherical import forward, inverse
+from s2fft.precompute_transforms.spherical import (
+    _cached_kernel,
+    clear_kernel_cache,
+    forward,
+    inverse,
+)
 from s2fft.sampling import s2_samples as samples
 
 jax.config.update("jax_enable_x64", True)
@@ -26,14 +33,82 @@ recursions_to_test = ["price-mcewen", "risbo", "auto"]
 iter_to_test = [0, 3]
 
 
+def _stable_recursion(case):
+    # price-mcewen recursion not accurate above |spin| = PM_MAX_STABLE_SPIN
+    if len(case) < 5:
+        return True
+    spin, _, _, _, recursion = case
+    return not (recursion == "price-mcewen" and abs(spin) >= PM_MAX_STABLE_SPIN)
+
+
+# Cover every pair of parameter values rather than the full Cartesian product.
+transform_cases = [
+    tuple(case)
+    for case in AllPairs(
+        [
+            spin_to_test,
+            sampling_to_test,
+            reality_to_test,
+            methods_to_test,
+            recursions_to_test,
+        ],
+        filter_func=_stable_recursion,
+    )
+]
+healpix_cases = [
+    tuple(case)
+    for case in AllPairs(
+        [
+            nside_to_test,
+            L_to_nside_ratio,
+            reality_to_test,
+            methods_to_test,
+            recursions_to_test,
+        ]
+    )
+]
+healpix_iter_cases = [
+    tuple(case)
+    for case in AllPairs(
+        [
+            nside_to_test,
+            L_to_nside_ratio,
+            reality_to_test,
+            methods_to_test,
+            recursions_to_test,
+            iter_to_test,
+        ]
+    )
+]
+
+
+@pytest.fixture
+def spin_kernel(kernel_cache, torch_kernel_cache):
+    """
+    Kernel builder for a given method, returning the session cached kernel, or its
+    cached torch copy for the torch method.
+    """
+
+    def build(method, L, spin, reality, sampling, nside=None, *, forward, recursion):
+        kfunc = (
+            c.spin_spherical_kernel_jax
+            if method.lower() == "jax"
+            else c.spin_spherical_kernel
+        )
+        cache = torch_kernel_cache if method.lower() == "torch" else kernel_cache
+        return cache(
+            kfunc, L, spin, reality, sampling, nside, forward, recursion=recursion
+        )
+
+    return build
+
+
 @pytest.mark.parametrize("L", L_to_test)
-@pytest.mark.parametrize("spin", spin_to_test)
-@pytest.mark.parametrize("sampling", sampling_to_test)
-@pytest.mark.parametrize("reality", reality_to_test)
-@pytest.mark.parametrize("method", methods_to_test)
-@pytest.mark.parametrize("recursion", recursions_to_test)
+@pytest.mark.parametrize("spin, sampling, reality, method, recursion", transform_cases)
 def test_transform_inverse(
     flm_generator,
+    spin_kernel,
+    transform_cache,
     L: int,
     spin: int,
     sampling: str,
@@ -41,64 +116,56 @@ def test_transform_inverse(
     method: str,
     recursion: str,
 ):
-    if recursion.lower() == "price-mcewen" and abs(spin) >= PM_MAX_STABLE_SPIN:
-        pytest.skip(
-            f"price-mcewen recursion not accurate above |spin| = {PM_MAX_STABLE_SPIN}"
-        )
-
     flm = flm_generator(L=L, spin=spin, reality=reality)
-    f_check = base.inverse(flm, L, spin, sampling, reality=reality)
+    f_check = transform_cache(base.inverse, flm, L, spin, sampling, reality=reality)
 
-    kfunc = (
-        c.spin_spherical_kernel_jax
-        if method.lower() == "jax"
-        else c.spin_spherical_kernel
+    kernel = spin_kernel(
+        method, L, spin, reality, sampling, forward=False, recursion=recursion
     )
-    kernel = kfunc(L, spin, reality, sampling, forward=False, recursion=recursion)
 
     tol = 1e-8 if sampling.lower() in ["dh", "gl"] else 1e-12
     if method.lower() == "torch":
+        flm_torch = torch.tensor(flm)
         f = inverse(
-            torch.from_numpy(flm),
+            flm_torch,
             L,
             spin,
-            torch.from_numpy(kernel),
+            kernel,
             sampling,
             reality,
             method,
         )
         # Test Transform
-        np.testing.assert_allclose(
-            f.resolve_conj().numpy(), f_check, atol=tol, rtol=tol
-        )
-        # Test Gradients
-        flm_grad_test = torch.from_numpy(flm)
-        flm_grad_test.requires_grad = True
-        assert torch.autograd.gradcheck(
-            inverse,
-            (
-                flm_grad_test,
-                L,
-                spin,
-                torch.from_numpy(kernel),
-                sampling,
-                reality,
-                method,
-            ),
+        torch.testing.assert_close(
+            f.resolve_conj(), torch.tensor(f_check), atol=tol, rtol=tol
         )
+        # Test Gradients, for a single recursion since they do not depend on how
+        # the kernel was built
+        if recursion == "auto":
+            assert torch.autograd.gradcheck(
+                inverse,
+                (
+                    flm_torch.clone().requires_grad_(True),
+                    L,
+                    spin,
+                    kernel,
+                    sampling,
+                    reality,
+                    method,
+                ),
+                fast_mode=True,
+            )
 
     else:
         f = inverse(flm, L, spin, kernel, sampling, reality, method)
         np.testing.assert_allclose(f, f_check, atol=tol, rtol=tol)
 
 
-@pytest.mark.parametrize("nside", nside_to_test)
-@pytest.mark.parametrize("ratio", L_to_nside_ratio)
-@pytest.mark.parametrize("reality", reality_to_test)
-@pytest.mark.parametrize("method", methods_to_test)
-@pytest.mark.parametrize("recursion", recursions_to_test)
+@pytest.mark.parametrize("nside, ratio, reality, method, recursion", healpix_cases)
 def test_transform_inverse_healpix(
     flm_generator,
+    spin_kernel,
+    transform_cache,
     nside: int,
     ratio: int,
     reality: bool,
@@ -108,23 +175,21 @@ def test_transform_inverse_healpix(
     sampling = "healpix"
     L = ratio * nside
     flm = flm_generator(L=L, reality=reality)
-    f_check = base.inverse(flm, L, 0, sampling, nside, reality)
+    f_check = transform_cache(base.inverse, flm, L, 0, sampling, nside, reality)
 
-    kfunc = (
-        c.spin_spherical_kernel_jax
-        if method.lower() == "jax"
-        else c.spin_spherical_kernel
+    kernel = spin_kernel(
+        method, L, 0, reality, sampling, nside, forward=False, recursion=recursion
     )
-    kernel = kfunc(L, 0, reality, sampling, nside, False, recursion=recursion)
 
     tol = 1e-8 if sampling.lower() in ["dh", "gl"] else 1e-12
     if method.lower() == "torch":
+        flm_torch = torch.tensor(flm)
         # Test Transform
         f = inverse(
-            torch.from_numpy(flm),
+            flm_torch,
             L,
             0,
-            torch.from_numpy(kernel),
+            kernel,
             sampling,
             reality,
             method,
@@ -132,35 +197,34 @@ def test_transform_inverse_healpix(
         )
         np.testing.assert_allclose(f, f_check, atol=tol, rtol=tol)
 
-        # Test Gradients
-        flm_grad_test = torch.from_numpy(flm)
-        flm_grad_test.requires_grad = True
-        assert torch.autograd.gradcheck(
-            inverse,
-            (
-                flm_grad_test,
-                L,
-                0,
-                torch.from_numpy(kernel),
-                sampling,
-                reality,
-                method,
-                nside,
-            ),
-        )
+        # Test Gradients, for a single recursion since they do not depend on how
+        # the kernel was built
+        if recursion == "auto":
+            assert torch.autograd.gradcheck(
+                inverse,
+                (
+                    flm_torch.clone().requires_grad_(True),
+                    L,
+                    0,
+                    kernel,
+                    sampling,
+                    reality,
+                    method,
+                    nside,
+                ),
+                fast_mode=True,
+            )
     else:
         f = inverse(flm, L, 0, kernel, sampling, reality, method, nside)
         np.testing.assert_allclose(f, f_check, atol=tol, rtol=tol)
 
 
 @pytest.mark.parametrize("L", L_to_test)
-@pytest.mark.parametrize("spin", spin_to_test)
-@pytest.mark.parametrize("sampling", sampling_to_test)
-@pytest.mark.parametrize("reality", reality_to_test)
-@pytest.mark.parametrize("method", methods_to_test)
-@pytest.mark.parametrize("recursion", recursions_to_test)
+@pytest.mark.parametrize("spin, sampling, reality, method, recursion", transform_cases)
 def test_transform_forward(
     flm_generator,
+    spin_kernel,
+    transform_cache,
     L: int,
     spin: int,
     sampling: str,
@@ -168,31 +232,24 @@ def test_transform_forward(
     method: str,
     recursion: str,
 ):
-    if recursion.lower() == "price-mcewen" and abs(spin) >= PM_MAX_STABLE_SPIN:
-        pytest.skip(
-            f"price-mcewen recursion not accurate above |spin| = {PM_MAX_STABLE_SPIN}"
-        )
-
     flm = flm_generator(L=L, spin=spin, reality=reality)
 
-    f = base.inverse(flm, L, spin, sampling, reality=reality)
-    flm_check = base.forward(f, L, spin, sampling, reality=reality)
+    f = transform_cache(base.inverse, flm, L, spin, sampling, reality=reality)
+    flm_check = transform_cache(base.forward, f, L, spin, sampling, reality=reality)
 
-    kfunc = (
-        c.spin_spherical_kernel_jax
-        if method.lower() == "jax"
-        else c.spin_spherical_kernel
+    kernel = spin_kernel(
+        method, L, spin, reality, sampling, forward=True, recursion=recursion
     )
-    kernel = kfunc(L, spin, reality, sampling, forward=True, recursion=recursion)
 
     tol = 1e-8 if sampling.lower() in ["dh", "gl"] else 1e-12
     if method.lower() == "torch":
+        f_torch = torch.tensor(f)
         # Test Transform
         flm_recov = forward(
-            torch.from_numpy(f),
+            f_torch,
             L,
             spin,
-            torch.from_numpy(kernel),
+            kernel,
             sampling,
             reality,
             method,
@@ -200,34 +257,34 @@ def test_transform_forward(
 
         np.testing.assert_allclose(flm_check, flm_recov, atol=tol, rtol=tol)
 
-        # Test Gradients
-        f_grad_test = torch.from_numpy(f)
-        f_grad_test.requires_grad = True
-        assert torch.autograd.gradcheck(
-            forward,
-            (
-                f_grad_test,
-                L,
-                spin,
-                torch.from_numpy(kernel),
-                sampling,
-                reality,
-                method,
-            ),
-        )
+        # Test Gradients, for a single recursion since they do not depend on how
+        # the kernel was built
+        if recursion == "auto":
+            assert torch.autograd.gradcheck(
+                forward,
+                (
+                    f_torch.clone().requires_grad_(True),
+                    L,
+                    spin,
+                    kernel,
+                    sampling,
+                    reality,
+                    method,
+                ),
+                fast_mode=True,
+            )
     else:
         flm_recov = forward(f, L, spin, kernel, sampling, reality, method)
         np.testing.assert_allclose(flm_check, flm_recov, atol=tol, rtol=tol)
 
 
-@pytest.mark.parametrize("nside", nside_to_test)
-@pytest.mark.parametrize("ratio", L_to_nside_ratio)
-@pytest.mark.parametrize("reality", reality_to_test)
-@pytest.mark.parametrize("method", methods_to_test)
-@pytest.mark.parametrize("recursion", recursions_to_test)
-@pytest.mark.parametrize("iter", iter_to_test)
+@pytest.mark.parametrize(
+    "nside, ratio, reality, method, recursion, iter", healpix_iter_cases
+)
 def test_transform_forward_healpix(
     flm_generator,
+    spin_kernel,
+    transform_cache,
     nside: int,
     ratio: int,
     reality: bool,
@@ -238,24 +295,24 @@ def test_transform_forward_healpix(
     sampling = "healpix"
     L = ratio * nside
     flm = flm_generator(L=L, reality=True)
-    f = base.inverse(flm, L, 0, sampling, nside, reality)
-    flm_check = base.forward(f, L, 0, sampling, nside, reality, iter=iter)
+    f = transform_cache(base.inverse, flm, L, 0, sampling, nside, reality)
+    flm_check = transform_cache(
+        base.forward, f, L, 0, sampling, nside, reality, iter=iter
+    )
 
-    kfunc = (
-        c.spin_spherical_kernel_jax
-        if method.lower() == "jax"
-        else c.spin_spherical_kernel
+    kernel = spin_kernel(
+        method, L, 0, reality, sampling, nside, forward=True, recursion=recursion
     )
-    kernel = kfunc(L, 0, reality, sampling, nside, True, recursion=recursion)
 
     tol = 1e-8 if sampling.lower() in ["dh", "gl"] else 1e-12
     if method.lower() == "torch":
+        f_torch = torch.tensor(f)
         # Test Transform
         flm_recov = forward(
-            torch.from_numpy(f),
+            f_torch,
             L,
             0,
-            torch.from_numpy(kernel),
+            kernel,
             sampling,
             reality,
             method,
@@ -264,70 +321,172 @@ def test_transform_forward_healpix(
         )
         np.testing.assert_allclose(flm_recov, flm_check, atol=tol, rtol=tol)
 
-        # Test Gradients
-        f_grad_test = torch.from_numpy(f)
-        f_grad_test.requires_grad = True
-        assert torch.autograd.gradcheck(
-            forward,
-            (
-                f_grad_test,
-                L,
-                0,
-                torch.from_numpy(kernel),
-                sampling,
-                reality,
-                method,
-                nside,
-                iter,
-            ),
-        )
+        # Test Gradients, for a single recursion since they do not depend on how
+        # the kernel was built
+        if recursion == "auto":
+            assert torch.autograd.gradcheck(
+                forward,
+                (
+                    f_torch.clone().requires_grad_(True),
+                    L,
+                    0,
+                    kernel,
+                    sampling,
+                    reality,
+                    method,
+                    nside,
+                    iter,
+                ),
+                fast_mode=True,
+            )
     else:
         flm_recov = forward(f, L, 0, kernel, sampling, reality, method, nside, iter)
         np.testing.assert_allclose(flm_recov, flm_check, atol=tol, rtol=tol)
 
 
-@pytest.mark.parametrize("spin", [0, 20, 30, -20, -30])
+@pytest.mark.parametrize("spin", [-2, 2, 6])
+@pytest.mark.parametrize("nside", nside_to_test)
+@pytest.mark.parametrize("recursion", recursions_to_test)
+def test_transform_healpix_spin(
+    flm_generator,
+    kernel_cache,
+    transform_cache,
+    spin: int,
+    nside: int,
+    recursion: str,
+):
+    sampling = "healpix"
+    L = 2 * nside
+    flm = flm_generator(L=L, spin=spin, reality=False)
+    f_check = transform_cache(base.inverse, flm, L, spin, sampling, nside)
+    flm_check = transform_cache(base.forward, f_check, L, spin, sampling, nside)
+
+    kernel = kernel_cache(
+        c.spin_spherical_kernel,
+        L,
+        spin,
+        False,
+        sampling,
+        nside,
+        False,
+        recursion=recursion,
+    )
+    f = inverse(flm, L, spin, kernel, sampling, False, "numpy", nside)
+    np.testing.assert_allclose(f, f_check, atol=1e-10, rtol=1e-10)
+
+    kernel = kernel_cache(
+        c.spin_spherical_kernel,
+        L,
+        spin,
+        False,
+        sampling,
+        nside,
+        True,
+        recursion=recursion,
+    )
+    flm_recov = forward(f_check, L, spin, kernel, sampling, False, "numpy", nside)
+    np.testing.assert_allclose(flm_recov, flm_check, atol=1e-10, rtol=1e-10)
+
+
+@pytest.mark.parametrize("sampling", sampling_to_test)
+@pytest.mark.parametrize("forward", [False, True])
+@pytest.mark.parametrize("spin", [-6, 6])
+def test_kernel_spin_exceeding_band_limit_vanishes(
+    sampling: str, forward: bool, spin: int
+):
+    L = 6
+    kernel = c.spin_spherical_kernel(
+        L, spin, False, sampling, forward=forward, recursion="price-mcewen"
+    )
+    assert not np.any(kernel)
+
+
+@pytest.mark.parametrize("method", ["numpy", "jax"])
+def test_kernel_mirror_thetas(method: str):
+    L = 6
+    thetas = np.array([0.3, 0.9, np.pi / 2])
+    mirror = c._mirror_thetas_jax if method == "jax" else c._mirror_thetas
+
+    delta = np.zeros((len(thetas), 2 * L - 1, 2 * L - 1))
+    delta_mirror = np.zeros_like(delta)
+    for el in range(L):
+        delta = recursions.risbo.compute_full_vectorised(delta, thetas, L, el)
+        delta_mirror = recursions.risbo.compute_full_vectorised(
+            delta_mirror, np.pi - thetas[::-1], L, el
+        )
+        # The equatorial ring is its own mirror image, so only the others are used.
+        np.testing.assert_allclose(mirror(delta, 2, el), delta_mirror[1:], atol=1e-14)
+
+
+@pytest.fixture(scope="module")
+def ssht_inverse():
+    """
+    Memoised pyssht reference inverse, shared by the high spin tests which
+    request it for the same signals.
+    """
+    cache = {}
+
+    def cached_inverse(flm, L, spin, sampling):
+        key = (L, spin, sampling, flm.tobytes())
+        if key not in cache:
+            f = ssht.inverse(
+                samples.flm_2d_to_1d(flm, L),
+                L,
+                Method=sampling.upper(),
+                Spin=spin,
+                Reality=False,
+            )
+            f.setflags(write=False)
+            cache[key] = f
+        return cache[key]
+
+    return cached_inverse
+
+
+@pytest.mark.parametrize("spin", [20, 30, -20, -30])
 @pytest.mark.parametrize("sampling", sampling_to_test)
 @pytest.mark.parametrize("reality", reality_to_test)
 def test_transform_inverse_high_spin(
-    flm_generator, spin: int, sampling: str, reality: bool
+    flm_generator,
+    kernel_cache,
+    ssht_inverse,
+    spin: int,
+    sampling: str,
+    reality: bool,
 ):
     L = 32
 
     flm = flm_generator(L=L, spin=spin, reality=reality)
-    f_check = ssht.inverse(
-        samples.flm_2d_to_1d(flm, L),
-        L,
-        Method=sampling.upper(),
-        Spin=spin,
-        Reality=False,
-    )
+    f_check = ssht_inverse(flm, L, spin, sampling)
 
-    kernel = c.spin_spherical_kernel(L, spin, reality, sampling, forward=False)
+    kernel = kernel_cache(
+        c.spin_spherical_kernel, L, spin, reality, sampling, forward=False
+    )
 
     f = inverse(flm, L, spin, kernel, sampling, reality, "numpy")
     tol = 1e-8 if sampling.lower() in ["dh", "gl"] else 1e-11
     np.testing.assert_allclose(f, f_check, atol=tol, rtol=tol)
 
 
-@pytest.mark.parametrize("spin", [0, 20, 30, -20, -30])
+@pytest.mark.parametrize("spin", [20, 30, -20, -30])
 @pytest.mark.parametrize("sampling", sampling_to_test)
 @pytest.mark.parametrize("reality", reality_to_test)
 def test_transform_forward_high_spin(
-    flm_generator, spin: int, sampling: str, reality: bool
+    flm_generator,
+    kernel_cache,
+    ssht_inverse,
+    spin: int,
+    sampling: str,
+    reality: bool,
 ):
     L = 32
 
     flm = flm_generator(L=L, spin=spin, reality=reality)
-    f = ssht.inverse(
-        samples.flm_2d_to_1d(flm, L),
-        L,
-        Method=sampling.upper(),
-        Spin=spin,
-        Reality=False,
-    )
+    f = ssht_inverse(flm, L, spin, sampling)
 
-    kernel = c.spin_spherical_kernel(L, spin, reality, sampling, forward=True)
+    kernel = kernel_cache(
+        c.spin_spherical_kernel, L, spin, reality, sampling, forward=True
+    )
 
     flm_recov = forward(f, L, spin, kernel, sampling, reality, "numpy")
     tol = 1e-8 if sampling.lower() in ["dh", "gl"] else 1e-12
@@ -348,3 +507,47 @@ def test_inverse_transform_unrecognised_method_raises():
     flm = np.zeros(samples.flm_shape(L))
     with pytest.raises(ValueError, match=f"{method} not recognised"):
         inverse(flm, L, method=method)
+
+
+@pytest.mark.parametrize("sampling", sampling_to_test)
+@pytest.mark.parametrize("method", methods_to_test)
+def test_transform_default_kernel_cached(
+    flm_generator, transform_cache, sampling: str, method: str
+):
+    L = 8
+    spin = 2
+    flm = flm_generator(L=L, spin=spin, reality=False)
+    f_check = transform_cache(base.inverse, flm, L, spin, sampling)
+    if method == "torch":
+        flm = torch.tensor(flm)
+
+    f = inverse(flm, L, spin, sampling=sampling, method=method)
+    hits = _cached_kernel.cache_info().hits
+    f_repeat = inverse(flm, L, spin, sampling=sampling, method=method)
+    assert _cached_kernel.cache_info().hits == hits + 1
+
+    clear_kernel_cache()
+    assert _cached_kernel.cache_info().currsize == 0
+
+    tol = 1e-8 if sampling.lower() in ["dh", "gl"] else 1e-12
+    np.testing.assert_allclose(f, f_check, atol=tol, rtol=tol)
+    np.testing.assert_allclose(f_repeat, f_check, atol=tol, rtol=tol)
+
+
+@pytest.mark.parametrize("sampling", sampling_to_test + ["healpix"])
+@pytest.mark.parametrize("reality", reality_to_test)
+def test_transform_torch_device(sampling: str, reality: bool):
+    # Tensors on the meta device hold no data, so any working array allocated on the
+    # CPU instead of the device of the input fails the transform without a GPU.
+    L = 8
+    nside = L // 2 if sampling == "healpix" else None
+    device = torch.device("meta")
+    f = torch.zeros(
+        samples.f_shape(L, sampling, nside), dtype=torch.complex128, device=device
+    )
+
+    flm = forward(f, L, sampling=sampling, reality=reality, method="torch", nside=nside)
+    assert flm.device == device
+
+    f = inverse(flm, L, sampling=sampling, reality=reality, method="torch", nside=nside)
+    assert f.device == device
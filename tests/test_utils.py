@@ -39,6 +39,22 @@ def test_flm_reindexing_functions_healpix(flm_generator):
     np.testing.assert_allclose(flm_2d, flm_2d_check, atol=1e-14)
 
 
+def test_flm_reindexing_functions_trailing_entries(flm_generator):
+    L = 16
+    flm_2d = flm_generator(L=L, spin=0, reality=True)
+    flm_1d = samples.flm_2d_to_1d(flm_2d, L)
+    flm_hp = samples.flm_2d_to_hp(flm_2d, L)
+
+    # Only the leading coefficients up to the band-limit are read.
+    padding = np.ones(3, dtype=np.complex128)
+    np.testing.assert_allclose(
+        samples.flm_1d_to_2d(np.concatenate((flm_1d, padding)), L), flm_2d, atol=1e-14
+    )
+    np.testing.assert_allclose(
+        samples.flm_hp_to_2d(np.concatenate((flm_hp, padding)), L), flm_2d, atol=1e-14
+    )
+
+
 def test_flm_reindexing_exceptions(flm_generator):
     L = 16
     spin = 0
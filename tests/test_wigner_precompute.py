@@ -1,7 +1,10 @@
+from functools import lru_cache
+
 import numpy as np
 import pytest
 import so3
 import torch
+from allpairspy import AllPairs
 
 from s2fft.base_transforms import wigner as base
 from s2fft.precompute_transforms import construct as c
@@ -14,18 +17,37 @@ nside_to_test = [4]
 L_to_nside_ratio = [2]
 reality_to_test = [False, True]
 sampling_schemes = ["mw", "mwss", "dh", "gl"]
+# SO3 benchmark only supports [mw, mwss] sampling.
+so3_sampling_schemes = ["mw", "mwss"]
 methods_to_test = ["numpy", "jax", "torch"]
 modes_to_test = ["auto", "fft", "direct"]
 
 
+def _valid_mode(case):
+    # Fourier based Wigner computation not valid for non-equiangular sampling
+    if len(case) < 5:
+        return True
+    _, sampling, _, _, mode = case
+    return not (mode == "fft" and sampling not in ["mw", "mwss", "dh"])
+
+
+# Cover every pair of parameter values rather than the full Cartesian product.
+transform_cases = [
+    tuple(case)
+    for case in AllPairs(
+        [N_to_test, sampling_schemes, reality_to_test, methods_to_test, modes_to_test],
+        filter_func=_valid_mode,
+    )
+]
+
+
 @pytest.mark.parametrize("L", L_to_test)
-@pytest.mark.parametrize("N", N_to_test)
-@pytest.mark.parametrize("sampling", sampling_schemes)
-@pytest.mark.parametrize("reality", reality_to_test)
-@pytest.mark.parametrize("method", methods_to_test)
-@pytest.mark.parametrize("mode", modes_to_test)
+@pytest.mark.parametrize("N, sampling, reality, method, mode", transform_cases)
 def test_inverse_wigner_transform(
     flmn_generator,
+    kernel_cache,
+    torch_kernel_cache,
+    transform_cache,
     L: int,
     N: int,
     sampling: str,
@@ -33,46 +55,44 @@ def test_inverse_wigner_transform(
     method: str,
     mode: str,
 ):
-    if mode.lower() == "fft" and sampling.lower() not in ["mw", "mwss", "dh"]:
-        pytest.skip(
-            f"Fourier based Wigner computation not valid for sampling={sampling}"
-        )
-
     flmn = flmn_generator(L=L, N=N, reality=reality)
 
-    f = base.inverse(flmn, L, N, 0, sampling, reality)
+    f = transform_cache(base.inverse, flmn, L, N, 0, sampling, reality)
 
     kfunc = c.wigner_kernel_jax if method == "jax" else c.wigner_kernel
-    kernel = kfunc(L, N, reality, sampling, forward=False, mode=mode)
+    cache = torch_kernel_cache if method == "torch" else kernel_cache
+    kernel = cache(kfunc, L, N, reality, sampling, forward=False, mode=mode)
 
     if method.lower() == "torch":
+        flmn_torch = torch.tensor(flmn)
         # Test Transform
         f_check = inverse(
-            torch.from_numpy(flmn),
+            flmn_torch,
             L,
             N,
-            torch.from_numpy(kernel),
+            kernel,
             sampling,
             reality,
             method,
         )
         np.testing.assert_allclose(f, f_check, atol=1e-5, rtol=1e-5)
 
-        # Test Gradients
-        flmn_grad_test = torch.from_numpy(flmn)
-        flmn_grad_test.requires_grad = True
-        assert torch.autograd.gradcheck(
-            inverse,
-            (
-                flmn_grad_test,
-                L,
-                N,
-                torch.from_numpy(kernel),
-                sampling,
-                reality,
-                method,
-            ),
-        )
+        # Test Gradients, for a single mode since they do not depend on how
+        # the kernel was built
+        if mode == "auto":
+            assert torch.autograd.gradcheck(
+                inverse,
+                (
+                    flmn_torch.clone().requires_grad_(True),
+                    L,
+                    N,
+                    kernel,
+                    sampling,
+                    reality,
+                    method,
+                ),
+                fast_mode=True,
+            )
 
     else:
         f_check = inverse(flmn, L, N, kernel, sampling, reality, method)
@@ -80,13 +100,12 @@ def test_inverse_wigner_transform(
 
 
 @pytest.mark.parametrize("L", L_to_test)
-@pytest.mark.parametrize("N", N_to_test)
-@pytest.mark.parametrize("sampling", sampling_schemes)
-@pytest.mark.parametrize("reality", reality_to_test)
-@pytest.mark.parametrize("method", methods_to_test)
-@pytest.mark.parametrize("mode", modes_to_test)
+@pytest.mark.parametrize("N, sampling, reality, method, mode", transform_cases)
 def test_forward_wigner_transform(
     flmn_generator,
+    kernel_cache,
+    torch_kernel_cache,
+    transform_cache,
     L: int,
     N: int,
     sampling: str,
@@ -94,46 +113,45 @@ def test_forward_wigner_transform(
     method: str,
     mode: str,
 ):
-    if mode.lower() == "fft" and sampling.lower() not in ["mw", "mwss", "dh"]:
-        pytest.skip(
-            f"Fourier based Wigner computation not valid for sampling={sampling}"
-        )
     flmn = flmn_generator(L=L, N=N, reality=reality)
 
-    f = base.inverse(flmn, L, N, sampling=sampling, reality=reality)
-    flmn = base.forward(f, L, N, sampling=sampling, reality=reality)
+    f = transform_cache(base.inverse, flmn, L, N, sampling=sampling, reality=reality)
+    flmn = transform_cache(base.forward, f, L, N, sampling=sampling, reality=reality)
 
     kfunc = c.wigner_kernel_jax if method == "jax" else c.wigner_kernel
-    kernel = kfunc(L, N, reality, sampling, forward=True, mode=mode)
+    cache = torch_kernel_cache if method == "torch" else kernel_cache
+    kernel = cache(kfunc, L, N, reality, sampling, forward=True, mode=mode)
 
     if method.lower() == "torch":
+        f_torch = torch.tensor(f)
         # Test Transform
         flmn_check = forward(
-            torch.from_numpy(f),
+            f_torch,
             L,
             N,
-            torch.from_numpy(kernel),
+            kernel,
             sampling,
             reality,
             method,
         )
         np.testing.assert_allclose(flmn, flmn_check, atol=1e-5, rtol=1e-5)
 
-        # Test Gradients
-        f_grad_test = torch.from_numpy(f)
-        f_grad_test.requires_grad = True
-        assert torch.autograd.gradcheck(
-            forward,
-            (
-                f_grad_test,
-                L,
-                N,
-                torch.from_numpy(kernel),
-                sampling,
-                reality,
-                method,
-            ),
-        )
+        # Test Gradients, for a single mode since they do not depend on how
+        # the kernel was built
+        if mode == "auto":
+            assert torch.autograd.gradcheck(
+                forward,
+                (
+                    f_torch.clone().requires_grad_(True),
+                    L,
+                    N,
+                    kernel,
+                    sampling,
+                    reality,
+                    method,
+                ),
+                fast_mode=True,
+            )
     else:
         flmn_check = forward(f, L, N, kernel, sampling, reality, method)
         np.testing.assert_allclose(flmn, flmn_check, atol=1e-5, rtol=1e-5)
@@ -146,6 +164,9 @@ def test_forward_wigner_transform(
 @pytest.mark.parametrize("method", methods_to_test)
 def test_inverse_wigner_transform_healpix(
     flmn_generator,
+    kernel_cache,
+    torch_kernel_cache,
+    transform_cache,
     nside: int,
     ratio: int,
     N: int,
@@ -156,18 +177,20 @@ def test_inverse_wigner_transform_healpix(
     L = ratio * nside
     flmn = flmn_generator(L=L, N=N, reality=reality)
 
-    f = base.inverse(flmn, L, N, 0, sampling, reality, nside)
+    f = transform_cache(base.inverse, flmn, L, N, 0, sampling, reality, nside)
 
     kfunc = c.wigner_kernel_jax if method == "jax" else c.wigner_kernel
-    kernel = kfunc(L, N, reality, sampling, nside, forward=False)
+    cache = torch_kernel_cache if method == "torch" else kernel_cache
+    kernel = cache(kfunc, L, N, reality, sampling, nside, forward=False)
 
     if method.lower() == "torch":
+        flmn_torch = torch.tensor(flmn)
         # Test Transform
         f_check = inverse(
-            torch.from_numpy(flmn),
+            flmn_torch,
             L,
             N,
-            torch.from_numpy(kernel),
+            kernel,
             sampling,
             reality,
             method,
@@ -176,20 +199,19 @@ def test_inverse_wigner_transform_healpix(
         np.testing.assert_allclose(np.real(f), np.real(f_check), atol=1e-5, rtol=1e-5)
 
         # Test Gradients
-        flmn_grad_test = torch.from_numpy(flmn)
-        flmn_grad_test.requires_grad = True
         assert torch.autograd.gradcheck(
             inverse,
             (
-                flmn_grad_test,
+                flmn_torch.clone().requires_grad_(True),
                 L,
                 N,
-                torch.from_numpy(kernel),
+                kernel,
                 sampling,
                 reality,
                 method,
                 nside,
             ),
+            fast_mode=True,
         )
 
     else:
@@ -204,6 +226,9 @@ def test_inverse_wigner_transform_healpix(
 @pytest.mark.parametrize("method", methods_to_test)
 def test_forward_wigner_transform_healpix(
     flmn_generator,
+    kernel_cache,
+    torch_kernel_cache,
+    transform_cache,
     nside: int,
     ratio: int,
     N: int,
@@ -214,19 +239,21 @@ def test_forward_wigner_transform_healpix(
     L = ratio * nside
     flmn = flmn_generator(L=L, N=N, reality=reality)
 
-    f = base.inverse(flmn, L, N, 0, sampling, reality, nside)
-    flmn_check = base.forward(f, L, N, 0, sampling, reality, nside)
+    f = transform_cache(base.inverse, flmn, L, N, 0, sampling, reality, nside)
+    flmn_check = transform_cache(base.forward, f, L, N, 0, sampling, reality, nside)
 
     kfunc = c.wigner_kernel_jax if method == "jax" else c.wigner_kernel
-    kernel = kfunc(L, N, reality, sampling, nside, forward=True)
+    cache = torch_kernel_cache if method == "torch" else kernel_cache
+    kernel = cache(kfunc, L, N, reality, sampling, nside, forward=True)
 
     if method.lower() == "torch":
+        f_torch = torch.tensor(f)
         # Test Transform
         flmn = forward(
-            torch.from_numpy(f),
+            f_torch,
             L,
             N,
-            torch.from_numpy(kernel),
+            kernel,
             sampling,
             reality,
             method,
@@ -235,20 +262,19 @@ def test_forward_wigner_transform_healpix(
         np.testing.assert_allclose(flmn, flmn_check, atol=1e-5, rtol=1e-5)
 
         # Test Gradients
-        f_grad_test = torch.from_numpy(f)
-        f_grad_test.requires_grad = True
         assert torch.autograd.gradcheck(
             forward,
             (
-                f_grad_test,
+                f_torch.clone().requires_grad_(True),
                 L,
                 N,
-                torch.from_numpy(kernel),
+                kernel,
                 sampling,
                 reality,
                 method,
                 nside,
             ),
+            fast_mode=True,
         )
 
     else:
@@ -256,34 +282,54 @@ def test_forward_wigner_transform_healpix(
         np.testing.assert_allclose(flmn, flmn_check, atol=1e-5, rtol=1e-5)
 
 
+@pytest.fixture(scope="module")
+def so3_reference(s2fft_to_so3_sampling):
+    """
+    Memoised so3 parameters and reference inverse, shared by the high N tests
+    which request them for the same band-limits, samplings and signals.
+    """
+
+    @lru_cache(maxsize=None)
+    def parameters(L, N, sampling):
+        return so3.create_parameter_dict(
+            L=L,
+            N=N,
+            sampling_scheme_str=s2fft_to_so3_sampling(sampling),
+            reality=False,
+        )
+
+    inverses = {}
+
+    def reference(flmn, L, N, sampling):
+        params = parameters(L, N, sampling)
+        key = (L, N, sampling, flmn.tobytes())
+        if key not in inverses:
+            inverses[key] = so3.inverse(samples.flmn_3d_to_1d(flmn, L, N), params)
+        return params, inverses[key]
+
+    return reference
+
+
 @pytest.mark.parametrize("L", [8, 16, 32])
 @pytest.mark.parametrize("fft_method", [True, False])
-@pytest.mark.parametrize("sampling", sampling_schemes)
+@pytest.mark.parametrize("sampling", so3_sampling_schemes)
 @pytest.mark.parametrize("reality", reality_to_test)
 def test_inverse_wigner_transform_high_N(
     flmn_generator,
-    s2fft_to_so3_sampling,
+    kernel_cache,
+    so3_reference,
     L: int,
     fft_method: bool,
     sampling: str,
     reality: bool,
 ):
-    if sampling.lower() in ["gl", "dh"]:
-        pytest.skip("SO3 benchmark only supports [mw, mwss] sampling.")
-
     N = int(L / np.log(L)) if fft_method else L
 
     flmn = flmn_generator(L=L, N=N, reality=reality)
 
-    params = so3.create_parameter_dict(
-        L=L,
-        N=N,
-        sampling_scheme_str=s2fft_to_so3_sampling(sampling),
-        reality=False,
-    )
-    f = so3.inverse(samples.flmn_3d_to_1d(flmn, L, N), params)
+    _, f = so3_reference(flmn, L, N, sampling)
 
-    kernel = c.wigner_kernel_jax(L, N, reality, sampling, forward=False)
+    kernel = kernel_cache(c.wigner_kernel_jax, L, N, reality, sampling, forward=False)
     f_check = inverse(flmn, L, N, kernel, sampling, reality, "numpy")
 
     np.testing.assert_allclose(f, f_check.flatten("C"), atol=1e-10, rtol=1e-10)
@@ -291,31 +337,22 @@ def test_inverse_wigner_transform_high_N(
 
 @pytest.mark.parametrize("L", [8, 16, 32])
 @pytest.mark.parametrize("fft_method", [True, False])
-@pytest.mark.parametrize("sampling", sampling_schemes)
+@pytest.mark.parametrize("sampling", so3_sampling_schemes)
 @pytest.mark.parametrize("reality", reality_to_test)
 def test_forward_wigner_transform_high_N(
     flmn_generator,
-    s2fft_to_so3_sampling,
+    kernel_cache,
+    so3_reference,
     L: int,
     fft_method: bool,
     sampling: str,
     reality: bool,
 ):
-    if sampling.lower() in ["gl", "dh"]:
-        pytest.skip("SO3 benchmark only supports [mw, mwss] sampling.")
-
     N = int(L / np.log(L)) if fft_method else L
 
     flmn = flmn_generator(L=L, N=N, reality=reality)
 
-    params = so3.create_parameter_dict(
-        L=L,
-        N=N,
-        sampling_scheme_str=s2fft_to_so3_sampling(sampling),
-        reality=False,
-    )
-
-    f_1D = so3.inverse(samples.flmn_3d_to_1d(flmn, L, N), params)
+    params, f_1D = so3_reference(flmn, L, N, sampling)
     f_3D = f_1D.reshape(
         samples._ngamma(N),
         samples._nbeta(L, sampling),
@@ -323,7 +360,7 @@ def test_forward_wigner_transform_high_N(
     )
     flmn_so3 = samples.flmn_1d_to_3d(so3.forward(f_1D, params), L, N)
 
-    kernel = c.wigner_kernel(L, N, reality, sampling, forward=True)
+    kernel = kernel_cache(c.wigner_kernel, L, N, reality, sampling, forward=True)
     flmn_check = forward(f_3D, L, N, kernel, sampling, reality, "numpy")
 
     np.testing.assert_allclose(flmn_so3, flmn_check, atol=1e-10, rtol=1e-10)
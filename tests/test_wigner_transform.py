@@ -27,6 +27,7 @@ reality_to_test = [False, True]
 @pytest.mark.parametrize("method", method_to_test)
 @pytest.mark.parametrize("reality", reality_to_test)
 @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.slow
 def test_inverse_wigner_transform(
     flmn_generator,
     L: int,
@@ -58,6 +59,7 @@ def test_inverse_wigner_transform(
 @pytest.mark.parametrize("method", method_to_test)
 @pytest.mark.parametrize("reality", reality_to_test)
 @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.slow
 def test_forward_wigner_transform(
     flmn_generator,
     L: int,
@@ -90,6 +92,7 @@ def test_forward_wigner_transform(
 @pytest.mark.parametrize("sampling", sampling_to_test)
 @pytest.mark.parametrize("reality", reality_to_test)
 @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.slow
 def test_ssht_c_backend_inverse_wigner_transform(
     flmn_generator, L: int, N: int, L_lower: int, sampling: str, reality: bool
 ):
@@ -107,6 +110,7 @@ def test_ssht_c_backend_inverse_wigner_transform(
 @pytest.mark.parametrize("sampling", sampling_to_test)
 @pytest.mark.parametrize("reality", reality_to_test)
 @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.slow
 def test_ssht_c_backend_forward_wigner_transform(
     flmn_generator, L: int, N: int, L_lower: int, sampling: str, reality: bool
 ):
@@ -119,6 +123,18 @@ def test_ssht_c_backend_forward_wigner_transform(
     np.testing.assert_allclose(flmn, flmn_check, atol=1e-12)
 
 
+@pytest.mark.parametrize("method", method_to_test)
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_wigner_transform_round_trip(flmn_generator, method: str):
+    L = 6
+    N = 2
+    flmn = flmn_generator(L=L, N=N)
+
+    f = wigner.inverse(flmn, L, N, method=method)
+    flmn_recov = wigner.forward(f, L, N, method=method)
+    np.testing.assert_allclose(flmn_recov, flmn, atol=1e-14)
+
+
 def test_N_exceptions(flmn_generator):
     N = 10
     L = 16